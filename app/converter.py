@@ -3,34 +3,85 @@ Main PDF to PPTX and PPTX to PDF conversion pipeline.
 """
 
 import fitz  # PyMuPDF
-from typing import List, Optional
+from typing import Iterator, List, Optional, Tuple
+from collections import OrderedDict, deque
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache, partial
+from itertools import islice
+import hashlib
 import logging
+import threading
+import time
 import io
 import tempfile
 import os
+import shutil
+import signal
 import subprocess
-import glob
 
 from pptx import Presentation
 from pptx.util import Inches
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+from pptx.opc.packuri import PackURI
+from pptx.parts.image import Image as PptxImage, ImagePart
 from reportlab.pdfgen import canvas
-from PIL import Image, ImageDraw, ImageFont
+from reportlab.lib import colors
+from reportlab.pdfbase import pdfmetrics
+from reportlab.pdfbase.ttfonts import TTFont
 import textwrap
 
-from .models import TextBlock, MINIMUM_TEXT_THRESHOLD
-from .utils import get_pdf_dimensions
+from .models import (TextBlock, SlideConfig, MINIMUM_TEXT_THRESHOLD,
+                     DEFAULT_OCR_DPI, FAST_OCR_DPI, MAX_PAGE_WORKERS,
+                     PDF_INFO_CACHE_SIZE, MAX_UPLOAD_BYTES,
+                     PDF_MAGIC, PDF_MAGIC_SEARCH_BYTES, ZIP_MAGIC, OCR_BATCH_SIZE,
+                     SLIDE_IMAGE_JPEG_QUALITY, IMAGE_RENDER_BLOCK_PAGES,
+                     LIBREOFFICE_CONVERT_TIMEOUT)
+from .utils import get_pdf_dimensions, split_page_ranges
 from .text_extraction import extract_text_blocks_pymupdf, has_sufficient_text, normalize_and_group_text_blocks
-from .ocr import ocr_page_lines
-from .layout import transform_blocks_to_pptx
+from .ocr import ocr_images_lines, render_page_image, init_ocr_worker, has_inprocess_ocr
+from .layout import transform_blocks_to_pptx, precompute_transform
 from .pptx_generator import create_pptx_from_blocks, calculate_optimal_slide_size
 
 logger = logging.getLogger(__name__)
 
+# Structural info of recently seen PDFs, keyed by content digest
+_pdf_info_cache: "OrderedDict[bytes, dict]" = OrderedDict()
+_pdf_info_lock = threading.Lock()
+
+# Process-wide OCR thread pool, see _get_ocr_thread_pool
+_ocr_thread_pool: Optional[ThreadPoolExecutor] = None
+_ocr_thread_pool_pid: Optional[int] = None
+_ocr_thread_pool_lock = threading.Lock()
+
+# Idle LibreOffice user profiles, see _acquire_libreoffice_profile
+_libreoffice_profiles: List[str] = []
+_libreoffice_profile_count = 0
+_libreoffice_profile_lock = threading.Lock()
+
+# Unicode fonts for the fallback PPTX renderer, resolved once at import
+REGULAR_FONT_PATHS = (
+    "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",
+    "/usr/share/fonts/dejavu/DejaVuSans.ttf",
+)
+BOLD_FONT_PATHS = (
+    "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf",
+    "/usr/share/fonts/dejavu/DejaVuSans-Bold.ttf",
+)
+_REGULAR_FONT_PATH = next((p for p in REGULAR_FONT_PATHS if os.path.exists(p)), None)
+_BOLD_FONT_PATH = next((p for p in BOLD_FONT_PATHS if os.path.exists(p)), None)
+
+# External converters, looked up once at import
+_HAS_LIBREOFFICE = shutil.which('libreoffice') is not None
+_HAS_PDFTOPPM = shutil.which('pdftoppm') is not None
+
 
 def pdf_to_pptx(pdf_bytes: bytes, 
                ocr_langs: str = 'eng', 
                dehyphenate: bool = True,
-               use_ocr: bool = True) -> bytes:
+               use_ocr: bool = True,
+               num_workers: Optional[int] = None,
+               digest: Optional[bytes] = None,
+               high_accuracy: bool = False) -> bytes:
     """
     Convert PDF bytes to PPTX bytes.
     
@@ -39,6 +90,11 @@ def pdf_to_pptx(pdf_bytes: bytes,
         ocr_langs: Tesseract language codes for OCR
         dehyphenate: Whether to remove end-of-line hyphenation
         use_ocr: If True, extract text with OCR. If False, convert pages to images.
+        num_workers: Maximum number of parallel page workers; defaults to
+            the CPU count, capped at MAX_PAGE_WORKERS
+        digest: get_pdf_digest of pdf_bytes, if the caller already has it
+        high_accuracy: OCR pages rendered in color at DEFAULT_OCR_DPI instead
+            of grayscale at FAST_OCR_DPI; slower, for hard-to-read scans
         
     Returns:
         PPTX file content as bytes
@@ -48,14 +104,18 @@ def pdf_to_pptx(pdf_bytes: bytes,
         Exception: If conversion fails
     """
     if use_ocr:
-        return _pdf_to_pptx_with_ocr(pdf_bytes, ocr_langs, dehyphenate)
+        return _pdf_to_pptx_with_ocr(pdf_bytes, ocr_langs, dehyphenate, num_workers, digest,
+                                     high_accuracy)
     else:
-        return _pdf_to_pptx_as_images(pdf_bytes)
+        return _pdf_to_pptx_as_images(pdf_bytes, num_workers, digest)
 
 
 def _pdf_to_pptx_with_ocr(pdf_bytes: bytes, 
                          ocr_langs: str = 'eng', 
-                         dehyphenate: bool = True) -> bytes:
+                         dehyphenate: bool = True,
+                         num_workers: Optional[int] = None,
+                         digest: Optional[bytes] = None,
+                         high_accuracy: bool = False) -> bytes:
     """
     Convert PDF to PPTX using OCR to extract and preserve text formatting.
     
@@ -63,52 +123,81 @@ def _pdf_to_pptx_with_ocr(pdf_bytes: bytes,
         pdf_bytes: PDF file content as bytes
         ocr_langs: Tesseract language codes for OCR
         dehyphenate: Whether to remove end-of-line hyphenation
+        num_workers: Maximum number of parallel page workers
+        digest: get_pdf_digest of pdf_bytes, if the caller already has it
+        high_accuracy: Render OCR pages in color at DEFAULT_OCR_DPI
         
     Returns:
         PPTX file content as bytes
     """
     try:
         logger.info("Starting PDF to PPTX conversion with OCR")
+        start_time = time.perf_counter()
         
-        # Open PDF document
-        doc = fitz.open(stream=pdf_bytes, filetype="pdf")
+        # Page count and first-page dimensions (cached from validation)
+        pdf_info = _probe_pdf(pdf_bytes, digest)
+        page_count = pdf_info['page_count']
         
-        if len(doc) == 0:
+        if page_count == 0:
             raise ValueError("Empty PDF")
         
-        # Get PDF dimensions from first page
-        first_page = doc[0]
-        pdf_width = first_page.rect.width
-        pdf_height = first_page.rect.height
-        page_count = len(doc)
+        pdf_width = pdf_info['page_width']
+        pdf_height = pdf_info['page_height']
         
         logger.info(f"Processing PDF: {page_count} pages, {pdf_width}x{pdf_height} points")
         
         # Calculate optimal slide configuration
         slide_config = calculate_optimal_slide_size(pdf_width, pdf_height)
         
-        # Process each page
-        all_page_blocks = []
-        
-        for page_num in range(page_count):
-            page = doc[page_num]
-            logger.info(f"Processing page {page_num + 1}/{page_count}")
-            
-            # Extract text blocks for this page
-            page_blocks = _extract_page_text_blocks(page, ocr_langs)
-            
-            # Normalize and group text blocks
-            normalized_blocks = normalize_and_group_text_blocks(page_blocks, dehyphenate)
-            
-            # Transform to PPTX coordinates
-            transformed_blocks = transform_blocks_to_pptx(
-                normalized_blocks, pdf_width, pdf_height, slide_config
-            )
+        num_workers = _page_worker_count(num_workers, page_count)
+        
+        if num_workers == 1 or has_inprocess_ocr():
+            # Render on this thread while OCR runs on threads: tesserocr
+            # releases the GIL, and with a single worker this still overlaps
+            # rendering page N+1 with recognizing page N
+            logger.info(f"Processing pages with at most {num_workers} concurrent OCR jobs")
+            with fitz.open(stream=pdf_bytes, filetype="pdf") as doc:
+                page_results = _process_pages_pipelined(
+                    doc, range(page_count), page_count, _get_ocr_thread_pool(),
+                    num_workers * 2, num_workers, ocr_langs, dehyphenate, pdf_width, pdf_height, slide_config,
+                    high_accuracy
+                )
+        else:
+            # pytesseract runs one subprocess per page, so spread pages over
+            # worker processes instead
+            logger.info(f"Processing pages with {num_workers} worker processes")
             
-            all_page_blocks.append(transformed_blocks)
-            logger.info(f"Page {page_num + 1}: {len(transformed_blocks)} text blocks")
-        
-        doc.close()
+            # Workers open the PDF from a file rather than receiving a pickled
+            # copy of the whole upload each; MuPDF then reads pages on demand
+            with tempfile.TemporaryDirectory(ignore_cleanup_errors=True) as temp_dir:
+                pdf_path = os.path.join(temp_dir, "input.pdf")
+                with open(pdf_path, 'wb') as f:
+                    f.write(pdf_bytes)
+                
+                # One contiguous block of pages per worker, so each worker opens
+                # the PDF (and warms up OCR) once rather than once per page
+                worker = partial(
+                    _process_page_range, pdf_path,
+                    page_count=page_count, ocr_langs=ocr_langs, dehyphenate=dehyphenate,
+                    pdf_width=pdf_width, pdf_height=pdf_height, slide_config=slide_config,
+                    high_accuracy=high_accuracy
+                )
+                page_results = []
+                with ProcessPoolExecutor(max_workers=num_workers,
+                                         initializer=init_ocr_worker,
+                                         initargs=(ocr_langs,)) as executor:
+                    for chunk_results in executor.map(worker, split_page_ranges(page_count, num_workers)):
+                        page_results.extend(chunk_results)
+        
+        # Pages finish out of order (OCR pages complete after native ones),
+        # so place each result by page number
+        all_page_blocks = [None] * page_count
+        for page_num, blocks in page_results:
+            all_page_blocks[page_num] = blocks
+        
+        total_blocks = sum(len(blocks) for blocks in all_page_blocks)
+        elapsed = time.perf_counter() - start_time
+        logger.info(f"Processed {page_count} pages in {elapsed:.2f}s, {total_blocks} total text blocks")
         
         # Generate PPTX
         pptx_bytes = create_pptx_from_blocks(all_page_blocks, slide_config)
@@ -121,12 +210,294 @@ def _pdf_to_pptx_with_ocr(pdf_bytes: bytes,
         raise Exception(f"OCR conversion failed: {str(e)}")
 
 
-def _pdf_to_pptx_as_images(pdf_bytes: bytes) -> bytes:
+def _page_worker_count(num_workers: Optional[int], page_count: int) -> int:
+    """
+    Get the number of page workers to use for a document.
+    
+    Args:
+        num_workers: Requested maximum, or None for the CPU count capped
+            at MAX_PAGE_WORKERS
+        page_count: Number of pages to process
+        
+    Returns:
+        Worker count between 1 and page_count
+    """
+    if num_workers is None:
+        num_workers = min(os.cpu_count() or 1, MAX_PAGE_WORKERS)
+    return max(1, min(num_workers, page_count))
+
+
+def _layout_page_blocks(page_blocks: List[TextBlock], dehyphenate: bool,
+                        pdf_width: float, pdf_height: float,
+                        slide_config: SlideConfig, transform: tuple) -> List[Tuple[int, int, int, int, str]]:
+    """
+    Normalize a page's extracted text blocks and move them to slide coordinates.
+    
+    Args:
+        page_blocks: Text blocks in PDF coordinates
+        dehyphenate: Whether to remove end-of-line hyphenation
+        pdf_width: PDF page width in points
+        pdf_height: PDF page height in points
+        slide_config: Slide configuration with dimensions
+        transform: Precomputed transform from precompute_transform
+        
+    Returns:
+        List of text blocks in PPTX EMU coordinates
+    """
+    # Normalize and group text blocks
+    normalized_blocks = normalize_and_group_text_blocks(page_blocks, dehyphenate)
+    
+    # Transform to PPTX coordinates
+    return transform_blocks_to_pptx(
+        normalized_blocks, pdf_width, pdf_height, slide_config, transform
+    )
+
+
+def _process_page_range(pdf_path: str, page_indices: range, page_count: int,
+                        ocr_langs: str, dehyphenate: bool,
+                        pdf_width: float, pdf_height: float,
+                        slide_config: SlideConfig,
+                        high_accuracy: bool = False) -> List[Tuple[int, List[Tuple[int, int, int, int, str]]]]:
+    """
+    Process a contiguous block of pages inside a worker process.
+    
+    PyMuPDF documents cannot be pickled, so each worker opens the PDF
+    file once and processes its whole block of pages, double-buffering
+    rendering and OCR on one helper thread.
+    
+    Args:
+        pdf_path: Path to the PDF file
+        page_indices: Zero-based page indices to process
+        (remaining arguments as for _process_pages_pipelined)
+        
+    Returns:
+        List of (page_num, transformed_blocks) tuples
+    """
+    with fitz.open(pdf_path, filetype="pdf") as doc, \
+            ThreadPoolExecutor(max_workers=1) as executor:
+        return _process_pages_pipelined(
+            doc, page_indices, page_count, executor, 2, 1,
+            ocr_langs, dehyphenate, pdf_width, pdf_height, slide_config, high_accuracy
+        )
+
+
+def _get_ocr_thread_pool() -> ThreadPoolExecutor:
+    """
+    Get the shared OCR thread pool, creating it on first use.
+    
+    The pool lives for the whole process so that per-thread Tesseract
+    engines survive across requests. A pool inherited through fork has no
+    running threads, so a new one is created in child processes.
+    
+    Returns:
+        ThreadPoolExecutor with MAX_PAGE_WORKERS threads
+    """
+    global _ocr_thread_pool, _ocr_thread_pool_pid
+    
+    with _ocr_thread_pool_lock:
+        if _ocr_thread_pool is None or _ocr_thread_pool_pid != os.getpid():
+            _ocr_thread_pool = ThreadPoolExecutor(max_workers=MAX_PAGE_WORKERS,
+                                                  thread_name_prefix="ocr")
+            _ocr_thread_pool_pid = os.getpid()
+        return _ocr_thread_pool
+
+
+def _process_pages_pipelined(doc: fitz.Document, page_indices: range, page_count: int,
+                             executor: ThreadPoolExecutor, max_pending: int, max_running: int,
+                             ocr_langs: str, dehyphenate: bool,
+                             pdf_width: float, pdf_height: float,
+                             slide_config: SlideConfig,
+                             high_accuracy: bool = False) -> List[Tuple[int, List[Tuple[int, int, int, int, str]]]]:
+    """
+    Extract, normalize and transform pages, running OCR on worker threads.
+    
+    PyMuPDF is not thread-safe, so the document is only read and rendered on
+    the calling thread; worker threads get detached images and run nothing
+    but Tesseract. Rendering the next pages therefore overlaps recognition
+    of the previous ones. With the pytesseract backend, pages are sent to
+    Tesseract in batches of OCR_BATCH_SIZE so that each process start and
+    model load is shared by several pages.
+    
+    At most max_pending OCR jobs are queued at a time, which bounds memory
+    on long scanned documents, and at most max_running of them recognize
+    at once, even on a larger shared executor.
+    
+    Args:
+        doc: Open PyMuPDF document
+        page_indices: Zero-based page indices to process
+        page_count: Total number of pages (for logging)
+        executor: Thread pool to run OCR on
+        max_pending: Maximum number of OCR jobs queued
+        max_running: Maximum number of OCR jobs running at once
+        ocr_langs: Tesseract language codes for OCR
+        dehyphenate: Whether to remove end-of-line hyphenation
+        pdf_width: PDF page width in points
+        pdf_height: PDF page height in points
+        slide_config: Slide configuration with dimensions
+        high_accuracy: Render OCR pages in color at DEFAULT_OCR_DPI instead
+            of grayscale at FAST_OCR_DPI
+        
+    Returns:
+        List of (page_num, transformed_blocks) tuples
+    """
+    # Scale factors and margins are the same for every page
+    transform = precompute_transform(pdf_width, pdf_height, slide_config)
+    layout = partial(_layout_page_blocks, dehyphenate=dehyphenate, pdf_width=pdf_width,
+                     pdf_height=pdf_height, slide_config=slide_config, transform=transform)
+    batch_size = 1 if has_inprocess_ocr() else OCR_BATCH_SIZE
+    dpi = DEFAULT_OCR_DPI if high_accuracy else FAST_OCR_DPI
+    ocr_slots = threading.Semaphore(max_running)
+    ocr_failures = []
+    results = []
+    pending = deque()
+    batch = []
+    
+    # Stream pages from the document and drop each one (and its image)
+    # before blocking on OCR, so only the current page is held in memory
+    pages = doc.pages(page_indices.start, page_indices.stop)
+    progress_step = max(1, -(-page_count // 10))  # At most ten progress messages
+    for page_num, page in zip(page_indices, pages):
+        logger.debug("Processing page %d/%d", page_num + 1, page_count)
+        if (page_num + 1) % progress_step == 0:
+            logger.info(f"Processing page {page_num + 1}/{page_count}")
+        
+        try:
+            native_blocks, sufficient = _extract_native_text_blocks(page)
+            if sufficient:
+                results.append((page_num, layout(native_blocks)))
+                continue
+            
+            image, pix = render_page_image(page, dpi, high_accuracy)
+            image = image.copy()  # Detach from the pixmap before handing off
+            pix = None  # Free memory
+        except Exception as e:
+            logger.error(f"Text extraction failed for page: {str(e)}")
+            results.append((page_num, []))  # Empty blocks for failed pages
+            continue
+        
+        # Native blocks come along in case OCR fails
+        page_rect = page.rect
+        batch.append((page_num, image, (page_rect.width, page_rect.height), native_blocks))
+        page = image = native_blocks = None
+        
+        if len(batch) >= batch_size:
+            pending.append(_submit_ocr_batch(executor, ocr_slots, batch, ocr_langs, dpi, high_accuracy))
+            batch = []
+            
+            if len(pending) >= max_pending:
+                results.extend(_collect_ocr_batch(doc, *pending.popleft(), layout, ocr_failures))
+    
+    if batch:
+        pending.append(_submit_ocr_batch(executor, ocr_slots, batch, ocr_langs, dpi, high_accuracy))
+    
+    while pending:
+        results.extend(_collect_ocr_batch(doc, *pending.popleft(), layout, ocr_failures))
+    
+    if len(ocr_failures) > 1:
+        logger.warning(f"OCR failed on {len(ocr_failures)} pages, used native extraction")
+    
+    return results
+
+
+def _submit_ocr_batch(executor: ThreadPoolExecutor, ocr_slots: threading.Semaphore,
+                      batch: list, ocr_langs: str,
+                      dpi: int, high_accuracy: bool) -> Tuple[List[int], list, Future]:
+    """
+    Queue OCR for a batch of rendered pages.
+    
+    Args:
+        executor: Thread pool to run OCR on
+        ocr_slots: Semaphore limiting the document's running OCR jobs;
+            a slot is taken before submitting and freed when the job ends
+        batch: List of (page_num, image, (width, height), native_blocks) tuples
+        ocr_langs: Tesseract language codes for OCR
+        dpi: DPI the pages were rendered at
+        high_accuracy: Whether the pages are high-accuracy renders
+        
+    Returns:
+        Tuple of (page_nums, native_blocks, future returning one block list
+        per page)
+    """
+    page_nums = [page_num for page_num, _, _, _ in batch]
+    images = [image for _, image, _, _ in batch]
+    page_sizes = [page_size for _, _, page_size, _ in batch]
+    native_blocks = [blocks for _, _, _, blocks in batch]
+    
+    # Wait for a slot here rather than on the executor's threads, so jobs
+    # beyond the document's limit don't tie up threads of the shared pool
+    ocr_slots.acquire()
+    try:
+        future = executor.submit(ocr_images_lines, images, dpi, page_sizes,
+                                 ocr_langs, high_accuracy)
+    except Exception:
+        ocr_slots.release()
+        raise
+    future.add_done_callback(lambda _: ocr_slots.release())
+    return page_nums, native_blocks, future
+
+
+def _collect_ocr_batch(doc: fitz.Document, page_nums: List[int],
+                       native_blocks: List[Optional[List[TextBlock]]], future: Future,
+                       layout, ocr_failures: List[int]) -> List[Tuple[int, List[Tuple[int, int, int, int, str]]]]:
+    """
+    Wait for a batch's OCR results and lay out their text blocks.
+    
+    Falls back to the native text if OCR failed, reusing the blocks
+    extracted before OCR. Pages that skipped extraction have almost no
+    text, so extracting them now is cheap.
+    
+    Args:
+        doc: Open PyMuPDF document
+        page_nums: Zero-based page indices in the batch
+        native_blocks: Native blocks per page, or None where extraction
+            was skipped
+        future: Future returning one OCR block list per page
+        layout: Callable turning PDF text blocks into slide blocks
+        ocr_failures: Pages whose OCR failed so far, extended in place
+        
+    Returns:
+        List of (page_num, transformed_blocks) tuples
+    """
+    try:
+        batch_blocks = future.result()
+    except (RuntimeError, OSError) as ocr_error:
+        # Tesseract errors are RuntimeErrors, a missing binary is an OSError.
+        # A document usually fails the same way on every page, so only the
+        # first failure is worth a warning.
+        if not ocr_failures:
+            logger.warning(f"OCR failed: {str(ocr_error)}, using native extraction")
+        else:
+            logger.debug("OCR failed: %s, using native extraction", ocr_error)
+        ocr_failures.extend(page_nums)
+        
+        batch_blocks = []
+        for page_num, page_blocks in zip(page_nums, native_blocks):
+            if page_blocks is None:
+                try:
+                    page_blocks = extract_text_blocks_pymupdf(doc[page_num])
+                except Exception as e:
+                    logger.error(f"Text extraction failed for page: {str(e)}")
+                    page_blocks = []
+            batch_blocks.append(page_blocks)
+    
+    results = []
+    for page_num, page_blocks in zip(page_nums, batch_blocks):
+        transformed_blocks = layout(page_blocks)
+        logger.debug("Page %d: %d text blocks", page_num + 1, len(transformed_blocks))
+        results.append((page_num, transformed_blocks))
+    
+    return results
+
+
+def _pdf_to_pptx_as_images(pdf_bytes: bytes, num_workers: Optional[int] = None,
+                           digest: Optional[bytes] = None) -> bytes:
     """
     Convert PDF to PPTX by placing each page as an image on a slide.
     
     Args:
         pdf_bytes: PDF file content as bytes
+        num_workers: Maximum number of parallel render workers
+        digest: get_pdf_digest of pdf_bytes, if the caller already has it
         
     Returns:
         PPTX file content as bytes
@@ -134,133 +505,215 @@ def _pdf_to_pptx_as_images(pdf_bytes: bytes) -> bytes:
     try:
         logger.info("Starting PDF to PPTX conversion as images")
         
-        # Create temporary directory
-        temp_dir = tempfile.mkdtemp()
+        # Page renders keep the first page's aspect ratio, which the
+        # (cached) probe already knows, so no image needs decoding
+        pdf_info = _probe_pdf(pdf_bytes, digest)
+        page_count = pdf_info['page_count']
+        aspect_ratio = pdf_info['page_aspect_ratio']
         
-        try:
+        if page_count == 0:
+            raise ValueError("Empty PDF")
+        
+        # Temporary directory, removed with its contents on exit
+        with tempfile.TemporaryDirectory(ignore_cleanup_errors=True) as temp_dir:
             # Save PDF to temporary file
             pdf_path = os.path.join(temp_dir, "input.pdf")
             with open(pdf_path, 'wb') as f:
                 f.write(pdf_bytes)
             
-            # Convert PDF pages to images
-            image_paths = _convert_pdf_to_images(pdf_path, temp_dir)
-            
-            if not image_paths:
-                raise ValueError("Failed to convert PDF pages to images")
-            
-            logger.info(f"Converted {len(image_paths)} pages to images")
-            
-            # Create a new presentation
-            from pptx import Presentation
-            from pptx.util import Inches
-            
-            presentation = Presentation()
-            
-            # Get slide dimensions from first image
-            with Image.open(image_paths[0]) as img:
-                img_width, img_height = img.size
-            
-            # Calculate aspect ratio
-            aspect_ratio = img_width / img_height
-            
-            # Set slide size based on image aspect ratio
-            # Standard slide size is 10x7.5 inches (4:3) or 13.33x7.5 inches (16:9)
-            if aspect_ratio > 1.5:  # Wider than 3:2, use 16:9
-                slide_width = Inches(13.33)
-                slide_height = Inches(7.5)
-            else:  # Use 4:3
-                slide_width = Inches(10)
-                slide_height = Inches(7.5)
-            
-            presentation.slide_width = slide_width
-            presentation.slide_height = slide_height
-            
-            # Add each image as a slide
-            for i, image_path in enumerate(sorted(image_paths)):
-                logger.info(f"Adding page {i + 1}/{len(image_paths)} as slide")
-                
-                # Add a blank slide
-                slide_layout = presentation.slide_layouts[6]  # Blank layout
-                slide = presentation.slides.add_slide(slide_layout)
+            # Pages are embedded as they come out of the renderer
+            try:
+                pptx_bytes = _build_image_presentation(
+                    _iter_page_images(pdf_path, page_count, num_workers), page_count, aspect_ratio
+                )
+            except Exception as e:
+                logger.error(f"Failed to convert PDF to images: {str(e)}")
                 
-                # Add image to slide
-                left = Inches(0.5)
-                top = Inches(0.5)
-                width = slide_width - Inches(1)  # 1 inch margins
-                height = slide_height - Inches(1)
+                # Try alternative method using pdftoppm if available
+                images = _convert_pdf_to_images_pdftoppm(pdf_path, temp_dir)
+                if not images:
+                    raise ValueError("Failed to convert PDF pages to images")
                 
-                pic = slide.shapes.add_picture(image_path, left, top, width, height)
-            
-            # Save presentation to bytes
-            pptx_buffer = io.BytesIO()
-            presentation.save(pptx_buffer)
-            pptx_bytes = pptx_buffer.getvalue()
+                pptx_bytes = _build_image_presentation(
+                    (image.getvalue() for image in images), len(images), aspect_ratio
+                )
             
             logger.info(f"Image conversion completed: {len(pptx_bytes)} bytes")
             return pptx_bytes
             
-        finally:
-            # Clean up
-            import shutil
-            try:
-                shutil.rmtree(temp_dir)
-            except:
-                pass
-            
     except Exception as e:
         logger.error(f"PDF to PPTX as images failed: {str(e)}")
         raise Exception(f"Image conversion failed: {str(e)}")
 
 
-def _convert_pdf_to_images(pdf_path: str, output_dir: str) -> List[str]:
+def _build_image_presentation(images: Iterator[bytes], page_count: int,
+                              aspect_ratio: float) -> bytes:
+    """
+    Build a presentation with one full-slide picture per page image.
+    
+    Args:
+        images: Encoded page images, in page order
+        page_count: Number of page images (for logging)
+        aspect_ratio: Page width divided by page height
+        
+    Returns:
+        PPTX file content as bytes
+    """
+    # Create a new presentation
+    presentation = Presentation()
+    
+    # Set slide size based on image aspect ratio
+    # Standard slide size is 10x7.5 inches (4:3) or 13.33x7.5 inches (16:9)
+    if aspect_ratio > 1.5:  # Wider than 3:2, use 16:9
+        slide_width = Inches(13.33)
+        slide_height = Inches(7.5)
+    else:  # Use 4:3
+        slide_width = Inches(10)
+        slide_height = Inches(7.5)
+    
+    presentation.slide_width = slide_width
+    presentation.slide_height = slide_height
+    
+    # Number new image parts after any the template already has
+    image_idx = max((part.partname.idx or 0
+                     for part in presentation.part.package.iter_parts()
+                     if part.partname.startswith("/ppt/media/image")), default=0)
+    
+    # Add each image as a slide
+    progress_step = max(1, -(-page_count // 10))  # At most ten progress messages
+    for i, image_data in enumerate(images):
+        logger.debug("Adding page %d/%d as slide", i + 1, page_count)
+        if (i + 1) % progress_step == 0:
+            logger.info(f"Added {i + 1}/{page_count} pages as slides")
+        
+        # Add a blank slide
+        slide_layout = presentation.slide_layouts[6]  # Blank layout
+        slide = presentation.slides.add_slide(slide_layout)
+        
+        # Add image to slide
+        left = Inches(0.5)
+        top = Inches(0.5)
+        width = slide_width - Inches(1)  # 1 inch margins
+        height = slide_height - Inches(1)
+        
+        image_idx += 1
+        _add_page_picture(slide, image_data, image_idx, left, top, width, height)
+    
+    # Save presentation to bytes
+    pptx_buffer = io.BytesIO()
+    presentation.save(pptx_buffer)
+    return pptx_buffer.getvalue()
+
+
+def _add_page_picture(slide, image_data: bytes, image_idx: int,
+                      left: int, top: int, width: int, height: int):
+    """
+    Add a page image to a slide as a new picture part.
+    
+    slide.shapes.add_picture looks for an identical image and picks the
+    next free part name by walking every part in the package, which makes
+    a deck of N page images O(N^2). Page renders are never identical, so
+    the part is created directly under a name numbered by the caller.
+    ImagePart construction and _add_pic_from_image_part are python-pptx
+    internals, which is why requirements.txt pins python-pptx exactly;
+    TestImageMode checks the saved package after any upgrade.
+    
+    Args:
+        slide: PPTX slide object
+        image_data: Encoded image file content
+        image_idx: Unused image part number
+        left: Picture left position in EMU
+        top: Picture top position in EMU
+        width: Picture width in EMU
+        height: Picture height in EMU
+    """
+    image = PptxImage.from_blob(image_data)
+    image_part = ImagePart(
+        PackURI(f"/ppt/media/image{image_idx}.{image.ext}"),
+        image.content_type, slide.part.package, image.blob
+    )
+    rId = slide.part.relate_to(image_part, RT.IMAGE)
+    slide.shapes._add_pic_from_image_part(image_part, rId, left, top, width, height)
+
+
+def _iter_page_images(pdf_path: str, page_count: int,
+                      num_workers: Optional[int] = None) -> Iterator[bytes]:
     """
-    Convert PDF pages to images using PyMuPDF.
+    Render PDF pages to JPEG images using PyMuPDF, yielding them in order.
+    
+    Rendering and encoding hold the GIL in PyMuPDF, so multi-page
+    documents are split into small blocks of pages rendered by worker
+    processes. Only a few blocks are queued ahead of the consumer, so
+    embedding earlier pages overlaps rendering later ones and the whole
+    document is never held in memory as images.
     
     Args:
         pdf_path: Path to PDF file
-        output_dir: Directory to save images
+        page_count: Number of pages in the PDF
+        num_workers: Maximum number of worker processes
+        
+    Yields:
+        JPEG file contents, in page order
+    """
+    num_workers = _page_worker_count(num_workers, page_count)
+    if num_workers <= 1:
+        yield from _iter_rendered_pages(pdf_path, range(page_count))
+        return
+    
+    logger.info(f"Rendering {page_count} pages with {num_workers} worker processes")
+    num_blocks = max(num_workers, -(-page_count // IMAGE_RENDER_BLOCK_PAGES))
+    pending = deque()
+    
+    with ProcessPoolExecutor(max_workers=num_workers) as executor:
+        for page_indices in split_page_ranges(page_count, num_blocks):
+            pending.append(executor.submit(_render_page_range_to_images, pdf_path, page_indices))
+            if len(pending) > num_workers:
+                yield from pending.popleft().result()
+        
+        while pending:
+            yield from pending.popleft().result()
+
+
+def _render_page_range_to_images(pdf_path: str, page_indices: range) -> List[bytes]:
+    """
+    Render a contiguous block of pages to JPEG images in a worker process.
+    
+    Args:
+        pdf_path: Path to PDF file
+        page_indices: Zero-based page indices to render
         
     Returns:
-        List of paths to generated image files
+        List of JPEG file contents, in page order
     """
-    try:
-        image_paths = []
-        doc = fitz.open(pdf_path)
+    return list(_iter_rendered_pages(pdf_path, page_indices))
+
+
+def _iter_rendered_pages(pdf_path: str, page_indices: range) -> Iterator[bytes]:
+    """
+    Render a contiguous block of pages to JPEG images one at a time.
+    
+    Args:
+        pdf_path: Path to PDF file
+        page_indices: Zero-based page indices to render
         
-        for page_num in range(len(doc)):
-            page = doc[page_num]
-            
-            # Get page dimensions
-            rect = page.rect
-            zoom = 2.0  # Zoom factor for better quality
-            mat = fitz.Matrix(zoom, zoom)
-            
+    Yields:
+        JPEG file contents, in page order
+    """
+    zoom = 2.0  # Zoom factor for better quality
+    mat = fitz.Matrix(zoom, zoom)
+    
+    with fitz.open(pdf_path) as doc:
+        for page_num, page in zip(page_indices, doc.pages(page_indices.start, page_indices.stop)):
             # Render page to image
             pix = page.get_pixmap(matrix=mat, alpha=False)
             
-            # Save image
-            image_path = os.path.join(output_dir, f"page_{page_num + 1:03d}.png")
-            pix.save(image_path)
-            
-            image_paths.append(image_path)
-            logger.info(f"Saved page {page_num + 1} as image: {image_path}")
-        
-        doc.close()
-        return image_paths
-        
-    except Exception as e:
-        logger.error(f"Failed to convert PDF to images: {str(e)}")
-        
-        # Try alternative method using pdftoppm if available
-        try:
-            return _convert_pdf_to_images_pdftoppm(pdf_path, output_dir)
-        except Exception as e2:
-            logger.error(f"pdftoppm also failed: {str(e2)}")
-            return []
+            # Encode in memory; JPEG through PIL (libjpeg-turbo) is several
+            # times quicker than both PNG and MuPDF's own JPEG writer
+            yield pix.pil_tobytes("JPEG", quality=SLIDE_IMAGE_JPEG_QUALITY)
+            logger.debug("Rendered page %d as image", page_num + 1)
 
 
-def _convert_pdf_to_images_pdftoppm(pdf_path: str, output_dir: str) -> List[str]:
+def _convert_pdf_to_images_pdftoppm(pdf_path: str, output_dir: str) -> List[io.BytesIO]:
     """
     Convert PDF pages to images using pdftoppm (fallback).
     
@@ -269,37 +722,72 @@ def _convert_pdf_to_images_pdftoppm(pdf_path: str, output_dir: str) -> List[str]
         output_dir: Directory to save images
         
     Returns:
-        List of paths to generated image files
+        List of in-memory image files, in page order
     """
     try:
         # Check if pdftoppm is available
-        result = subprocess.run(['which', 'pdftoppm'], 
-                              capture_output=True, text=True)
-        if result.returncode != 0:
+        if not _HAS_PDFTOPPM:
             logger.warning("pdftoppm not found in PATH")
             return []
         
+        # pdftoppm renders pages one after another, so split larger
+        # documents into page ranges converted by concurrent processes
+        try:
+            with fitz.open(pdf_path) as doc:
+                page_count = doc.page_count
+        except Exception:
+            page_count = 0  # Unreadable here; let pdftoppm take the whole file
+        
+        num_workers = min(os.cpu_count() or 1, MAX_PAGE_WORKERS, page_count)
+        if num_workers > 1:
+            page_args = [['-f', str(r.start + 1), '-l', str(r.stop)]
+                         for r in split_page_ranges(page_count, num_workers)]
+        else:
+            page_args = [[]]
+        
         # Convert PDF to PNG using pdftoppm
         output_pattern = os.path.join(output_dir, "page")
-        cmd = [
-            'pdftoppm',
-            '-png',
-            '-r', '150',  # 150 DPI for good quality
-            pdf_path,
-            output_pattern
-        ]
+        processes = []
+        for args in page_args:
+            cmd = [
+                'pdftoppm',
+                '-png',
+                '-r', '150',  # 150 DPI for good quality
+                *args,
+                pdf_path,
+                output_pattern
+            ]
+            
+            logger.info(f"Running pdftoppm: {' '.join(cmd)}")
+            processes.append(subprocess.Popen(cmd, stdout=subprocess.DEVNULL,
+                                              stderr=subprocess.PIPE))
         
-        logger.info(f"Running pdftoppm: {' '.join(cmd)}")
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=60)
+        errors = []
+        try:
+            for process in processes:
+                _, stderr = process.communicate(timeout=60)
+                if process.returncode != 0:
+                    errors.append(stderr)
+        finally:
+            for process in processes:
+                if process.poll() is None:
+                    process.kill()
+                    process.wait()
         
-        if result.returncode == 0:
+        if not errors:
             # Find generated PNG files
-            image_paths = glob.glob(os.path.join(output_dir, "page*.png"))
-            image_paths.sort()
+            image_paths = sorted(entry.path for entry in os.scandir(output_dir)
+                                 if entry.name.startswith("page") and entry.name.endswith(".png"))
             logger.info(f"pdftoppm converted {len(image_paths)} pages")
-            return image_paths
+            
+            images = []
+            for image_path in image_paths:
+                with open(image_path, 'rb') as f:
+                    images.append(io.BytesIO(f.read()))
+            return images
         else:
-            logger.warning(f"pdftoppm failed: {result.stderr}")
+            stderr = errors[0].decode('utf-8', errors='replace')
+            logger.warning(f"pdftoppm failed: {stderr}")
             return []
             
     except Exception as e:
@@ -309,7 +797,10 @@ def _convert_pdf_to_images_pdftoppm(pdf_path: str, output_dir: str) -> List[str]
 
 def pptx_to_pdf(pptx_bytes: bytes) -> bytes:
     """
-    Convert PPTX bytes to PDF bytes by converting each slide to an image.
+    Convert PPTX bytes to PDF bytes.
+    
+    Decks are exported straight to PDF with LibreOffice when available;
+    otherwise slide text is drawn directly onto the PDF pages.
     
     Args:
         pptx_bytes: PPTX file content as bytes
@@ -324,222 +815,286 @@ def pptx_to_pdf(pptx_bytes: bytes) -> bytes:
     try:
         logger.info("Starting PPTX to PDF conversion")
         
-        # Create temporary directory for all files
-        temp_dir = tempfile.mkdtemp()
+        # Only LibreOffice needs the deck on disk; without it stay in memory
+        if not _HAS_LIBREOFFICE:
+            logger.warning("LibreOffice not found in PATH, using fallback method")
+            return _convert_pptx_to_pdf_fallback(pptx_bytes)
         
-        try:
+        # Temporary directory for all files, removed with its contents on exit
+        with tempfile.TemporaryDirectory(ignore_cleanup_errors=True) as temp_dir:
             # Save PPTX to temporary file
             pptx_path = os.path.join(temp_dir, "input.pptx")
             with open(pptx_path, 'wb') as f:
                 f.write(pptx_bytes)
             
-            # Convert PPTX to images using LibreOffice
-            image_paths = _convert_pptx_to_images_libreoffice(pptx_path, temp_dir)
+            # Convert the whole deck to PDF using LibreOffice
+            pdf_path = _convert_pptx_to_pdf_libreoffice(pptx_path, temp_dir)
             
-            if not image_paths:
-                # Fallback: Use python-pptx method
+            if pdf_path is None:
+                # Fallback: Draw slide text directly with python-pptx + ReportLab
                 logger.info("LibreOffice conversion failed, using fallback method")
-                image_paths = _convert_pptx_to_images_fallback(pptx_path, temp_dir)
-            
-            if not image_paths:
-                raise ValueError("Failed to convert any slides to images")
-            
-            logger.info(f"Found {len(image_paths)} images to convert to PDF")
-            
-            # Get dimensions from first image
-            with Image.open(image_paths[0]) as img:
-                img_width, img_height = img.size
-            
-            # Standard PDF DPI is 72, images are typically 96 DPI
-            # Convert image pixels to PDF points
-            pdf_width = img_width * (72 / 96)
-            pdf_height = img_height * (72 / 96)
-            
-            # Create PDF from images
-            pdf_buffer = io.BytesIO()
-            c = canvas.Canvas(pdf_buffer, pagesize=(pdf_width, pdf_height))
+                return _convert_pptx_to_pdf_fallback(pptx_bytes)
             
-            for i, image_path in enumerate(sorted(image_paths)):
-                logger.info(f"Adding slide {i + 1}/{len(image_paths)} to PDF")
-                
-                # Add image to PDF page
-                c.drawImage(image_path, 0, 0, pdf_width, pdf_height)
-                
-                # Add new page for next slide (except last one)
-                if i < len(image_paths) - 1:
-                    c.showPage()
-            
-            # Save PDF
-            c.save()
-            pdf_bytes = pdf_buffer.getvalue()
+            with open(pdf_path, 'rb') as f:
+                pdf_bytes = f.read()
             
             logger.info(f"Conversion completed: {len(pdf_bytes)} bytes")
             return pdf_bytes
             
-        finally:
-            # Clean up temporary directory
-            import shutil
-            try:
-                shutil.rmtree(temp_dir)
-            except:
-                pass
-            
     except Exception as e:
         logger.error(f"PPTX to PDF conversion failed: {str(e)}")
         raise Exception(f"Conversion failed: {str(e)}")
 
 
-def _convert_pptx_to_images_libreoffice(pptx_path: str, output_dir: str) -> List[str]:
+def _convert_pptx_to_pdf_libreoffice(pptx_path: str, output_dir: str) -> Optional[str]:
     """
-    Convert PPTX slides to images using LibreOffice.
+    Convert a PPTX file to PDF using LibreOffice.
+    
+    LibreOffice renders every slide as vector PDF in one pass; its PNG
+    export would only produce the first slide. Each call runs with its own
+    user profile so that concurrent conversions don't block each other.
+    The 'libreoffice' launcher runs the office as a child process, so the
+    run gets its own process group, which is killed as a whole on timeout.
     
     Args:
         pptx_path: Path to PPTX file
-        output_dir: Directory to save images
+        output_dir: Directory to save the PDF
         
     Returns:
-        List of paths to generated image files
+        Path to the generated PDF, or None if conversion failed
     """
+    profile_dir = _acquire_libreoffice_profile()
+    discard_profile = False
     try:
-        # Check if LibreOffice is available
-        result = subprocess.run(['which', 'libreoffice'], 
-                              capture_output=True, text=True)
-        if result.returncode != 0:
-            logger.warning("LibreOffice not found in PATH")
-            return []
-        
-        # Convert PPTX to PNG using LibreOffice
         cmd = [
             'libreoffice',
+            f'-env:UserInstallation=file://{profile_dir}',
             '--headless',
-            '--convert-to', 'png',
+            '--convert-to', 'pdf',
             '--outdir', output_dir,
             pptx_path
         ]
         
         logger.info(f"Running LibreOffice conversion: {' '.join(cmd)}")
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=60)
+        process = subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+                                   start_new_session=True)
+        try:
+            _, stderr = process.communicate(timeout=LIBREOFFICE_CONVERT_TIMEOUT)
+        except subprocess.TimeoutExpired:
+            os.killpg(process.pid, signal.SIGKILL)
+            process.communicate()
+            # A killed office can leave its profile locked
+            discard_profile = True
+            logger.warning("LibreOffice conversion timed out")
+            return None
+        
+        # Output is named after the input file
+        pdf_path = os.path.join(
+            output_dir, os.path.splitext(os.path.basename(pptx_path))[0] + ".pdf"
+        )
         
-        if result.returncode == 0:
+        if process.returncode == 0 and os.path.exists(pdf_path):
             logger.info("LibreOffice conversion successful")
-            
-            # Find all PNG files in output directory
-            image_paths = glob.glob(os.path.join(output_dir, "*.png"))
-            
-            # Sort by filename to maintain slide order
-            image_paths.sort()
-            
-            logger.info(f"Found {len(image_paths)} PNG files")
-            return image_paths
+            return pdf_path
         else:
-            logger.warning(f"LibreOffice conversion failed: {result.stderr}")
-            return []
+            stderr = stderr.decode('utf-8', errors='replace')
+            logger.warning(f"LibreOffice conversion failed: {stderr}")
+            return None
             
-    except subprocess.TimeoutExpired:
-        logger.warning("LibreOffice conversion timed out")
-        return []
     except Exception as e:
         logger.warning(f"LibreOffice conversion error: {str(e)}")
-        return []
+        return None
+    finally:
+        _release_libreoffice_profile(profile_dir, discard_profile)
+
+
+def _acquire_libreoffice_profile() -> str:
+    """
+    Take an idle LibreOffice user profile directory for one conversion.
+    
+    LibreOffice locks its user profile, so a second instance sharing the
+    default profile fails instead of running. Each concurrent conversion
+    gets its own profile; profiles are reused afterwards so that the
+    one-time profile setup is only paid once per concurrent slot.
+    
+    Returns:
+        Absolute path of the profile directory
+    """
+    global _libreoffice_profile_count
+    
+    with _libreoffice_profile_lock:
+        if _libreoffice_profiles:
+            return _libreoffice_profiles.pop()
+        _libreoffice_profile_count += 1
+        return os.path.join(
+            tempfile.gettempdir(),
+            f"libreoffice-profile-{os.getpid()}-{_libreoffice_profile_count}"
+        )
 
 
-def _convert_pptx_to_images_fallback(pptx_path: str, output_dir: str) -> List[str]:
+def _release_libreoffice_profile(profile_dir: str, discard: bool = False):
     """
-    Fallback method to convert PPTX to images using python-pptx.
+    Return a profile taken with _acquire_libreoffice_profile.
     
     Args:
-        pptx_path: Path to PPTX file
-        output_dir: Directory to save images
+        profile_dir: Profile directory path
+        discard: Delete the profile instead of reusing it
+    """
+    if discard:
+        shutil.rmtree(profile_dir, ignore_errors=True)
+        return
+    
+    with _libreoffice_profile_lock:
+        _libreoffice_profiles.append(profile_dir)
+
+
+def remove_libreoffice_profiles():
+    """
+    Delete the idle LibreOffice user profiles created by this process.
+    
+    Intended for service shutdown; profiles still in use are left alone.
+    """
+    prefix = f"libreoffice-profile-{os.getpid()}-"
+    
+    with _libreoffice_profile_lock:
+        profile_dirs = [d for d in _libreoffice_profiles
+                        if os.path.basename(d).startswith(prefix)]
+        _libreoffice_profiles.clear()
+    
+    for profile_dir in profile_dirs:
+        shutil.rmtree(profile_dir, ignore_errors=True)
+
+
+def _convert_pptx_to_pdf_fallback(pptx_bytes: bytes) -> bytes:
+    """
+    Fallback method to convert PPTX to PDF using python-pptx and ReportLab.
+    
+    Slide text is drawn directly onto the PDF canvas as vector text, so no
+    intermediate slide images are rendered, encoded or decoded.
+    
+    Args:
+        pptx_bytes: PPTX file content as bytes
         
     Returns:
-        List of paths to generated image files
-    """
-    try:
-        presentation = Presentation(pptx_path)
-        image_paths = []
+        PDF file content as bytes
         
-        for slide_idx, slide in enumerate(presentation.slides):
-            # Create image for this slide
-            image_path = os.path.join(output_dir, f"slide_{slide_idx + 1:03d}.png")
-            
-            # Get slide dimensions
-            slide_width = presentation.slide_width.inches
-            slide_height = presentation.slide_height.inches
-            
-            # Convert to pixels (96 DPI)
-            width_px = int(slide_width * 96)
-            height_px = int(slide_height * 96)
-            
-            # Create slide image
-            _create_slide_image(slide, slide_idx + 1, width_px, height_px, image_path)
-            
-            image_paths.append(image_path)
-            logger.info(f"Created fallback image for slide {slide_idx + 1}")
+    Raises:
+        ValueError: If the presentation has no slides
+    """
+    presentation = Presentation(io.BytesIO(pptx_bytes))
+    slide_count = len(presentation.slides)
+    
+    if slide_count == 0:
+        raise ValueError("Presentation contains no slides")
+    
+    # Slide dimensions in PDF points, the same for every slide
+    page_width = presentation.slide_width.inches * 72
+    page_height = presentation.slide_height.inches * 72
+    
+    pdf_buffer = io.BytesIO()
+    c = canvas.Canvas(pdf_buffer, pagesize=(page_width, page_height))
+    
+    for slide_idx, slide in enumerate(presentation.slides):
+        _draw_slide_fallback(c, slide, slide_idx + 1, page_width, page_height)
+        c.showPage()
+        logger.debug("Drew fallback page for slide %d", slide_idx + 1)
+    
+    c.save()
+    pdf_bytes = pdf_buffer.getvalue()
+    
+    logger.info(f"Fallback conversion completed: {slide_count} slides, {len(pdf_bytes)} bytes")
+    return pdf_bytes
+
+
+@lru_cache(maxsize=8)
+def _get_font(bold: bool = False) -> str:
+    """
+    Get the name of a registered ReportLab font for fallback rendering.
+    
+    The DejaVu TrueType font is parsed and registered once per process;
+    the built-in Helvetica fonts are used when it is not installed.
+    
+    Args:
+        bold: Whether to return the bold variant
         
-        return image_paths
+    Returns:
+        Font name usable with canvas.setFont
+    """
+    font_path = _BOLD_FONT_PATH if bold else _REGULAR_FONT_PATH
+    font_name = "DejaVuSans-Bold" if bold else "DejaVuSans"
+    
+    if font_path:
+        try:
+            pdfmetrics.registerFont(TTFont(font_name, font_path))
+            return font_name
+        except Exception as e:
+            logger.warning(f"Failed to load font {font_path}: {str(e)}")
+    
+    return "Helvetica-Bold" if bold else "Helvetica"
+
+
+@lru_cache(maxsize=4096)
+def _text_width(text: str, font_name: str, font_size: float) -> float:
+    """
+    Measure a string for centring, memoized across slides.
+    
+    Decks repeat the same lines (footers, titles, bullet text) on many
+    slides, and measuring a TrueType string walks its glyph metrics.
+    
+    Args:
+        text: Text to measure
+        font_name: Registered ReportLab font name
+        font_size: Font size in points
         
-    except Exception as e:
-        logger.error(f"Fallback conversion failed: {str(e)}")
-        return []
+    Returns:
+        Text width in points
+    """
+    return pdfmetrics.stringWidth(text, font_name, font_size)
 
 
-def _create_slide_image(slide, slide_num: int, width_px: int, height_px: int, output_path: str):
+def _draw_slide_fallback(c: canvas.Canvas, slide, slide_num: int,
+                         page_width: float, page_height: float):
     """
-    Create an image representation of a slide.
+    Draw a simple representation of a slide onto the current PDF page.
     
     Args:
+        c: ReportLab canvas positioned on the page to draw
         slide: PPTX slide object
         slide_num: Slide number (1-based)
-        width_px: Image width in pixels
-        height_px: Image height in pixels
-        output_path: Path to save the image
+        page_width: Page width in PDF points
+        page_height: Page height in PDF points
     """
+    body_font = _get_font()
+    
     try:
-        # Create a white background
-        img = Image.new('RGB', (width_px, height_px), color='white')
-        draw = ImageDraw.Draw(img)
-        
-        # Try to load fonts
-        try:
-            font_large = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", 28)
-            font_medium = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", 18)
-            font_small = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", 14)
-        except:
-            # Fallback to default font
-            font_large = ImageFont.load_default()
-            font_medium = ImageFont.load_default()
-            font_small = ImageFont.load_default()
-        
         # Draw slide header
-        title = f"Slide {slide_num}"
-        title_width = draw.textlength(title, font=font_large)
-        draw.text(
-            ((width_px - title_width) // 2, 50),
-            title,
-            fill='darkblue',
-            font=font_large
-        )
+        c.setFillColor(colors.darkblue)
+        c.setFont(_get_font(bold=True), 21)
+        c.drawCentredString(page_width / 2, page_height - 60, f"Slide {slide_num}")
         
         # Draw separator line
-        draw.line([(50, 100), (width_px - 50, 100)], fill='gray', width=2)
-        
-        # Extract and draw text from shapes
-        y_offset = 130
-        shapes_with_text = []
-        
-        for shape in slide.shapes:
-            if hasattr(shape, "text") and shape.text.strip():
-                shapes_with_text.append(shape)
+        c.setStrokeColor(colors.gray)
+        c.setLineWidth(1.5)
+        c.line(37.5, page_height - 75, page_width - 37.5, page_height - 75)
+        
+        # Extract and draw text from shapes; shape.text re-walks the shape
+        # XML on every access, so read it only once per shape. At most ten
+        # shapes are drawn, so stop reading shapes after that
+        y_offset = page_height - 108
+        shape_texts = list(islice(
+            filter(None, (shape.text_frame.text.strip()
+                          for shape in slide.shapes if shape.has_text_frame)),
+            10
+        ))
+        
+        c.setFillColor(colors.black)
+        c.setFont(body_font, 10.5)
         
         # Limit to avoid overflow
-        max_shapes = min(10, len(shapes_with_text))
-        
-        for i in range(max_shapes):
-            shape = shapes_with_text[i]
-            text = shape.text.strip()
-            
-            if not text:
-                continue
+        for text in shape_texts:
+            # Nothing more fits on the page, so don't wrap the rest
+            if y_offset <= 37.5:
+                break
             
             # Truncate long text
             if len(text) > 100:
@@ -549,114 +1104,202 @@ def _create_slide_image(slide, slide_num: int, width_px: int, height_px: int, ou
             wrapped_lines = textwrap.wrap(text, width=50)
             
             for line in wrapped_lines:
-                if y_offset < height_px - 50:
-                    line_width = draw.textlength(line, font=font_small)
-                    draw.text(
-                        ((width_px - line_width) // 2, y_offset),
-                        line,
-                        fill='black',
-                        font=font_small
-                    )
-                    y_offset += 25
+                if y_offset > 37.5:
+                    line_width = _text_width(line, body_font, 10.5)
+                    c.drawString((page_width - line_width) / 2, y_offset, line)
+                    y_offset -= 18.75
         
         # If no text was found, add a message
-        if not shapes_with_text:
-            message = "Slide contains no extractable text"
-            msg_width = draw.textlength(message, font=font_medium)
-            draw.text(
-                ((width_px - msg_width) // 2, height_px // 2),
-                message,
-                fill='gray',
-                font=font_medium
-            )
-        
-        # Save the image
-        img.save(output_path, 'PNG', quality=90)
+        if not shape_texts:
+            c.setFillColor(colors.gray)
+            c.setFont(body_font, 13.5)
+            c.drawCentredString(page_width / 2, page_height / 2,
+                                "Slide contains no extractable text")
         
     except Exception as e:
-        logger.error(f"Failed to create slide image: {str(e)}")
-        # Create a simple fallback image
-        img = Image.new('RGB', (width_px, height_px), color='lightgray')
-        draw = ImageDraw.Draw(img)
-        
-        try:
-            font = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", 24)
-        except:
-            font = ImageFont.load_default()
-        
-        text = f"Slide {slide_num}"
-        text_width = draw.textlength(text, font=font)
-        draw.text(
-            ((width_px - text_width) // 2, height_px // 2 - 20),
-            text,
-            fill='darkred',
-            font=font
-        )
+        logger.error(f"Failed to draw slide {slide_num}: {str(e)}")
+        # Cover anything partially drawn with a simple placeholder
+        c.setFillColor(colors.lightgrey)
+        c.rect(0, 0, page_width, page_height, stroke=0, fill=1)
+        
+        c.setFillColor(colors.darkred)
+        c.setFont(body_font, 18)
+        c.drawCentredString(page_width / 2, page_height / 2 + 15, f"Slide {slide_num}")
+        c.drawCentredString(page_width / 2, page_height / 2 - 15, "Content could not be rendered")
+
+
+def _extract_native_text_blocks(page: fitz.Page) -> Tuple[Optional[List[TextBlock]], bool]:
+    """
+    Extract native text blocks from a page and check whether they suffice.
+    
+    Plain text length is an upper bound on the stripped block text, so
+    scanned pages skip building the full block dict altogether. Both are
+    read from one text page, so text-rich pages still have their content
+    interpreted only once. Pages with little text but no images or vector
+    paths (blank pages, short captions) have nothing for OCR to find, so
+    they keep their native text.
+    
+    Args:
+        page: PyMuPDF page object
         
-        msg = "Content could not be rendered"
-        msg_width = draw.textlength(msg, font=font)
-        draw.text(
-            ((width_px - msg_width) // 2, height_px // 2 + 20),
-            msg,
-            fill='darkred',
-            font=font
-        )
+    Returns:
+        Tuple of (native_blocks, sufficient); native_blocks is None when
+        extraction was skipped, sufficient is False when OCR is needed
+    """
+    page_area = page.rect.width * page.rect.height
+    textpage = page.get_textpage()
+    
+    raw_chars = len(page.get_text("text", textpage=textpage))
+    if not has_sufficient_text([], total_chars=raw_chars, page_area=page_area):
+        if not _page_has_graphics(page):
+            logger.debug("Insufficient native text (%d chars) but no graphics, skipping OCR", raw_chars)
+            return (extract_text_blocks_pymupdf(page, textpage) if raw_chars else []), True
+        logger.debug("Insufficient native text (%d chars), using OCR", raw_chars)
+        return None, False
+    
+    native_blocks = extract_text_blocks_pymupdf(page, textpage)
+    
+    if has_sufficient_text(native_blocks, page_area=page_area):
+        logger.debug("Using native text extraction: %d blocks", len(native_blocks))
+        return native_blocks, True
+    
+    if logger.isEnabledFor(logging.DEBUG):
+        total_chars = sum(len(b[4].strip()) for b in native_blocks)
+        logger.debug("Insufficient native text (%d chars), using OCR", total_chars)
+    return native_blocks, False
+
+
+def _page_has_graphics(page: fitz.Page) -> bool:
+    """
+    Check whether a page draws any images or vector paths.
+    
+    Uses the page's bounding box log, which lists drawing operations
+    without building image or path objects.
+    
+    Args:
+        page: PyMuPDF page object
         
-        img.save(output_path, 'PNG')
+    Returns:
+        True if the page has anything besides text for OCR to recognize
+    """
+    return any(not op.endswith('-text') for op, _ in page.get_bboxlog())
 
 
-def _extract_page_text_blocks(page: fitz.Page, ocr_langs: str) -> List[TextBlock]:
+def _page_needs_ocr(page: fitz.Page) -> bool:
     """
-    Extract text blocks from a single PDF page using native extraction or OCR.
+    Cheaply predict whether a page will be sent to OCR.
+    
+    Uses the same plain-text and graphics checks as
+    _extract_native_text_blocks, without extracting text blocks.
     
     Args:
         page: PyMuPDF page object
-        ocr_langs: Language codes for OCR
         
     Returns:
-        List of text blocks
+        True if the page is expected to need OCR
     """
-    try:
-        # First, try native text extraction
-        native_blocks = extract_text_blocks_pymupdf(page)
+    page_area = page.rect.width * page.rect.height
+    raw_chars = len(page.get_text("text"))
+    return (not has_sufficient_text([], total_chars=raw_chars, page_area=page_area)
+            and _page_has_graphics(page))
+
+
+def get_pdf_digest(pdf_bytes: bytes) -> bytes:
+    """
+    Get the content digest used as the PDF info cache key.
+    
+    Callers that pass one upload to several of validate_pdf, get_pdf_info,
+    estimate_processing_time and pdf_to_pptx can compute the digest once
+    and pass it to each, instead of every call re-hashing the whole upload.
+    
+    Args:
+        pdf_bytes: PDF file content as bytes
         
-        # Check if we have sufficient text
-        if has_sufficient_text(native_blocks):
-            logger.debug(f"Using native text extraction: {len(native_blocks)} blocks")
-            return native_blocks
-        else:
-            logger.debug(f"Insufficient native text ({sum(len(b[4]) for b in native_blocks)} chars), using OCR")
-            
-        # Fall back to OCR
-        try:
-            ocr_blocks = ocr_page_lines(page, langs=ocr_langs)
-            logger.debug(f"OCR extracted {len(ocr_blocks)} blocks")
-            return ocr_blocks
-            
-        except Exception as ocr_error:
-            logger.warning(f"OCR failed: {str(ocr_error)}, using native extraction")
-            return native_blocks
+    Returns:
+        16-byte BLAKE2b digest of the content
+    """
+    return hashlib.blake2b(pdf_bytes, digest_size=16).digest()
+
+
+def _probe_pdf(pdf_bytes: bytes, digest: Optional[bytes] = None) -> dict:
+    """
+    Read page count, first-page dimensions and metadata from a PDF.
+    
+    Results are cached by content digest, so the usual validate -> info ->
+    estimate -> convert sequence on the same upload parses the PDF once.
+    The returned dictionary is shared and must not be modified.
+    
+    Args:
+        pdf_bytes: PDF file content as bytes
+        digest: get_pdf_digest of pdf_bytes, if the caller already has it
+        
+    Returns:
+        Dictionary with page_count, page_width, page_height,
+        page_aspect_ratio, ocr_page_fraction and metadata
+        
+    Raises:
+        Exception: If the PDF cannot be opened
+    """
+    if digest is None:
+        digest = get_pdf_digest(pdf_bytes)
+    
+    with _pdf_info_lock:
+        info = _pdf_info_cache.get(digest)
+        if info is not None:
+            _pdf_info_cache.move_to_end(digest)
+            return info
+    
+    with fitz.open(stream=pdf_bytes, filetype="pdf") as doc:
+        page_count = doc.page_count
+        info = {
+            'page_count': page_count,
+            'page_width': None,
+            'page_height': None,
+            'page_aspect_ratio': None,
+            'ocr_page_fraction': 0.0,
+            'metadata': dict(doc.metadata or {}),
+        }
+        if page_count > 0:
+            first_page = doc[0]
+            info['page_width'] = first_page.rect.width
+            info['page_height'] = first_page.rect.height
+            info['page_aspect_ratio'] = info['page_width'] / info['page_height']
             
-    except Exception as e:
-        logger.error(f"Text extraction failed for page: {str(e)}")
-        return []  # Return empty blocks for failed pages
+            # Sample the first and middle pages, so the time estimate can
+            # tell scanned documents from born-digital ones
+            sample_pages = sorted({0, page_count // 2})
+            ocr_pages = sum(1 for page_num in sample_pages if _page_needs_ocr(doc[page_num]))
+            info['ocr_page_fraction'] = ocr_pages / len(sample_pages)
+    
+    with _pdf_info_lock:
+        _pdf_info_cache[digest] = info
+        while len(_pdf_info_cache) > PDF_INFO_CACHE_SIZE:
+            _pdf_info_cache.popitem(last=False)
+    
+    return info
 
 
-def validate_pdf(pdf_bytes: bytes) -> bool:
+def validate_pdf(pdf_bytes: bytes, digest: Optional[bytes] = None) -> bool:
     """
     Validate that the input is a valid PDF.
     
     Args:
         pdf_bytes: PDF file content as bytes
+        digest: get_pdf_digest of pdf_bytes, if the caller already has it
         
     Returns:
         True if valid PDF, False otherwise
     """
+    # Cheap header and size checks before handing the bytes to MuPDF
+    if len(pdf_bytes) > MAX_UPLOAD_BYTES:
+        logger.error(f"PDF validation failed: file too large ({len(pdf_bytes)} bytes)")
+        return False
+    if PDF_MAGIC not in pdf_bytes[:PDF_MAGIC_SEARCH_BYTES]:
+        logger.error("PDF validation failed: missing %PDF header")
+        return False
+    
     try:
-        doc = fitz.open(stream=pdf_bytes, filetype="pdf")
-        is_valid = len(doc) > 0
-        doc.close()
-        return is_valid
+        return _probe_pdf(pdf_bytes, digest)['page_count'] > 0
     except Exception as e:
         logger.error(f"PDF validation failed: {str(e)}")
         return False
@@ -672,46 +1315,41 @@ def validate_pptx(pptx_bytes: bytes) -> bool:
     Returns:
         True if valid PPTX, False otherwise
     """
+    # Cheap header and size checks before unpacking the archive
+    if len(pptx_bytes) > MAX_UPLOAD_BYTES:
+        logger.error(f"PPTX validation failed: file too large ({len(pptx_bytes)} bytes)")
+        return False
+    if not pptx_bytes.startswith(ZIP_MAGIC):
+        logger.error("PPTX validation failed: not a ZIP archive")
+        return False
+    
     try:
-        with tempfile.NamedTemporaryFile(suffix='.pptx', delete=False) as tmp_file:
-            tmp_file.write(pptx_bytes)
-            tmp_path = tmp_file.name
-        
-        try:
-            presentation = Presentation(tmp_path)
-            # Check if we can access basic properties
-            _ = len(presentation.slides)
-            return True
-        except Exception as e:
-            logger.error(f"PPTX validation failed: {str(e)}")
-            return False
-        finally:
-            try:
-                os.unlink(tmp_path)
-            except:
-                pass
-            
+        presentation = Presentation(io.BytesIO(pptx_bytes))
+        # Check if we can access basic properties
+        _ = len(presentation.slides)
+        return True
     except Exception as e:
-        logger.error(f"PPTX file handling failed: {str(e)}")
+        logger.error(f"PPTX validation failed: {str(e)}")
         return False
 
 
-def get_pdf_info(pdf_bytes: bytes) -> dict:
+def get_pdf_info(pdf_bytes: bytes, digest: Optional[bytes] = None) -> dict:
     """
     Extract basic information from a PDF.
     
     Args:
         pdf_bytes: PDF file content as bytes
+        digest: get_pdf_digest of pdf_bytes, if the caller already has it
         
     Returns:
         Dictionary with PDF information
     """
     try:
-        doc = fitz.open(stream=pdf_bytes, filetype="pdf")
+        pdf_info = _probe_pdf(pdf_bytes, digest)
         
-        metadata = doc.metadata or {}
+        metadata = pdf_info['metadata']
         info = {
-            'page_count': len(doc),
+            'page_count': pdf_info['page_count'],
             'title': metadata.get('title', ''),
             'author': metadata.get('author', ''),
             'subject': metadata.get('subject', ''),
@@ -721,13 +1359,11 @@ def get_pdf_info(pdf_bytes: bytes) -> dict:
             'modification_date': metadata.get('modDate', ''),
         }
         
-        if len(doc) > 0:
-            first_page = doc[0]
-            info['page_width'] = first_page.rect.width
-            info['page_height'] = first_page.rect.height
-            info['page_aspect_ratio'] = first_page.rect.width / first_page.rect.height
+        if pdf_info['page_count'] > 0:
+            info['page_width'] = pdf_info['page_width']
+            info['page_height'] = pdf_info['page_height']
+            info['page_aspect_ratio'] = pdf_info['page_aspect_ratio']
         
-        doc.close()
         return info
         
     except Exception as e:
@@ -746,57 +1382,52 @@ def get_pptx_info(pptx_bytes: bytes) -> dict:
         Dictionary with PPTX information
     """
     try:
-        with tempfile.NamedTemporaryFile(suffix='.pptx', delete=False) as tmp_file:
-            tmp_file.write(pptx_bytes)
-            tmp_path = tmp_file.name
+        presentation = Presentation(io.BytesIO(pptx_bytes))
         
-        try:
-            presentation = Presentation(tmp_path)
-            
-            info = {
-                'slide_count': len(presentation.slides),
-                'slide_width_inches': presentation.slide_width.inches,
-                'slide_height_inches': presentation.slide_height.inches,
-                'slide_width_points': presentation.slide_width.inches * 72,
-                'slide_height_points': presentation.slide_height.inches * 72,
-                'slide_aspect_ratio': presentation.slide_width.inches / presentation.slide_height.inches,
-            }
-            
-            return info
-            
-        finally:
-            try:
-                os.unlink(tmp_path)
-            except:
-                pass
+        # Each slide size access goes back to the presentation XML
+        width_inches = presentation.slide_width.inches
+        height_inches = presentation.slide_height.inches
+        
+        info = {
+            'slide_count': len(presentation.slides),
+            'slide_width_inches': width_inches,
+            'slide_height_inches': height_inches,
+            'slide_width_points': width_inches * 72,
+            'slide_height_points': height_inches * 72,
+            'slide_aspect_ratio': width_inches / height_inches,
+        }
+        
+        return info
             
     except Exception as e:
         logger.error(f"Failed to get PPTX info: {str(e)}")
         return {'error': str(e)}
 
 
-def estimate_processing_time(pdf_bytes: bytes, use_ocr: bool = True) -> float:
+def estimate_processing_time(pdf_bytes: bytes, use_ocr: bool = True,
+                             digest: Optional[bytes] = None) -> float:
     """
     Estimate processing time for a PDF based on page count and content complexity.
     
     Args:
         pdf_bytes: PDF file content as bytes
         use_ocr: Whether OCR will be used
+        digest: get_pdf_digest of pdf_bytes, if the caller already has it
         
     Returns:
         Estimated processing time in seconds
     """
     try:
-        doc = fitz.open(stream=pdf_bytes, filetype="pdf")
-        page_count = len(doc)
-        doc.close()
+        pdf_info = _probe_pdf(pdf_bytes, digest)
+        page_count = pdf_info['page_count']
         
         if use_ocr:
             # OCR mode
             base_time_per_page = 2.0
             ocr_time_per_page = 5.0
-            # Assume 50% of pages might need OCR
-            estimated_time = (page_count * base_time_per_page) + (page_count * 0.5 * ocr_time_per_page)
+            # Share of OCR pages as sampled by the probe
+            ocr_pages = page_count * pdf_info['ocr_page_fraction']
+            estimated_time = (page_count * base_time_per_page) + (ocr_pages * ocr_time_per_page)
         else:
             # Image mode (faster)
             estimated_time = page_count * 1.0
@@ -2,18 +2,47 @@
 Layout and positioning engine for converting PDF coordinates to PPTX coordinates.
 """
 
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 import logging
 
-from .models import TextBlock, SlideConfig, pdf_points_to_emu, emu_to_pdf_points
-from .utils import apply_margin, scale_coordinates
+from .models import TextBlock, SlideConfig, emu_to_pdf_points, PDF_POINTS_PER_INCH, PPTX_EMU_PER_INCH
 
 logger = logging.getLogger(__name__)
 
 
+def precompute_transform(pdf_width: float, pdf_height: float,
+                         slide_config: SlideConfig) -> Tuple[float, float, float, float, float, float]:
+    """
+    Precompute the PDF to slide transform for a page size.
+    
+    Args:
+        pdf_width: PDF page width in points
+        pdf_height: PDF page height in points
+        slide_config: Slide configuration with dimensions
+        
+    Returns:
+        Tuple of (scale_x, scale_y, margin_x, margin_y, slide_width, slide_height),
+        with slide dimensions and margins in points
+    """
+    slide_width = slide_config.width_pts
+    slide_height = slide_config.height_pts
+    
+    # Calculate scaling factors
+    scale_x = slide_width / pdf_width
+    scale_y = slide_height / pdf_height
+    
+    # Calculate margin amounts
+    margin_x = slide_width * slide_config.margin_factor
+    margin_y = slide_height * slide_config.margin_factor
+    
+    return scale_x, scale_y, margin_x, margin_y, slide_width, slide_height
+
+
 def transform_blocks_to_pptx(text_blocks: List[TextBlock], 
                            pdf_width: float, pdf_height: float,
-                           slide_config: SlideConfig) -> List[Tuple[int, int, int, int, str]]:
+                           slide_config: SlideConfig,
+                           transform: Optional[Tuple[float, float, float, float, float, float]] = None
+                           ) -> List[Tuple[int, int, int, int, str]]:
     """
     Transform PDF text blocks to PPTX coordinates with proper scaling.
     
@@ -22,6 +51,8 @@ def transform_blocks_to_pptx(text_blocks: List[TextBlock],
         pdf_width: PDF page width in points
         pdf_height: PDF page height in points
         slide_config: Slide configuration with dimensions
+        transform: Result of precompute_transform for these dimensions, to
+            avoid recomputing it for every page
         
     Returns:
         List of text blocks in PPTX EMU coordinates
@@ -31,35 +62,35 @@ def transform_blocks_to_pptx(text_blocks: List[TextBlock],
     
     transformed_blocks = []
     
-    # Calculate scaling factors
-    scale_x = slide_config.width_pts / pdf_width
-    scale_y = slide_config.height_pts / pdf_height
+    if transform is None:
+        transform = precompute_transform(pdf_width, pdf_height, slide_config)
+    scale_x, scale_y, margin_x, margin_y, slide_width, slide_height = transform
     
-    # Calculate margin amounts
-    margin_x = slide_config.width_pts * slide_config.margin_factor
-    margin_y = slide_config.height_pts * slide_config.margin_factor
-    
-    logger.info(f"Transforming {len(text_blocks)} blocks with scale ({scale_x:.3f}, {scale_y:.3f})")
+    logger.debug("Transforming %d blocks with scale (%.3f, %.3f)", len(text_blocks), scale_x, scale_y)
     
+    # Same math as scale_coordinates/apply_margin/pdf_points_to_emu, inlined
+    # to avoid seven function calls per block
     for x0, y0, x1, y1, text in text_blocks:
-        # Scale coordinates
-        scaled_x0, scaled_y0 = scale_coordinates(x0, y0, scale_x, scale_y)
-        scaled_x1, scaled_y1 = scale_coordinates(x1, y1, scale_x, scale_y)
+        # Scale coordinates and apply margins with bounds checking
+        final_x0 = max(0, x0 * scale_x + margin_x)
+        final_y0 = max(0, y0 * scale_y + margin_y)
+        final_x1 = min(slide_width, x1 * scale_x - margin_x)
+        final_y1 = min(slide_height, y1 * scale_y - margin_y)
         
-        # Apply margins and bounds checking
-        final_x0, final_y0, final_x1, final_y1 = apply_margin(
-            scaled_x0, scaled_y0, scaled_x1, scaled_y1,
-            margin_x, margin_y,
-            slide_config.width_pts, slide_config.height_pts
-        )
+        # Ensure minimum size
+        if final_x1 <= final_x0:
+            final_x1 = min(slide_width, final_x0 + 50)  # Minimum 50 points width
+        if final_y1 <= final_y0:
+            final_y1 = min(slide_height, final_y0 + 20)  # Minimum 20 points height
         
         # Convert to EMU units
-        emu_x0 = pdf_points_to_emu(final_x0)
-        emu_y0 = pdf_points_to_emu(final_y0)
-        emu_x1 = pdf_points_to_emu(final_x1)
-        emu_y1 = pdf_points_to_emu(final_y1)
-        
-        transformed_blocks.append((emu_x0, emu_y0, emu_x1, emu_y1, text))
+        transformed_blocks.append((
+            int(final_x0 * PPTX_EMU_PER_INCH / PDF_POINTS_PER_INCH),
+            int(final_y0 * PPTX_EMU_PER_INCH / PDF_POINTS_PER_INCH),
+            int(final_x1 * PPTX_EMU_PER_INCH / PDF_POINTS_PER_INCH),
+            int(final_y1 * PPTX_EMU_PER_INCH / PDF_POINTS_PER_INCH),
+            text
+        ))
     
     return transformed_blocks
 
@@ -3,9 +3,8 @@ FastAPI web service for PDF to PPTX and PPTX to PDF conversion.
 """
 
 from fastapi import FastAPI, File, UploadFile, HTTPException
-from fastapi.responses import StreamingResponse, HTMLResponse
+from fastapi.responses import Response, HTMLResponse
 from fastapi.middleware.cors import CORSMiddleware
-import io
 import logging
 from typing import Optional
 
@@ -15,9 +14,11 @@ from .converter import (
     validate_pdf,
     validate_pptx,
     get_pdf_info,
+    get_pdf_digest,
     get_pptx_info,
     estimate_processing_time,
-    estimate_pptx_processing_time
+    estimate_pptx_processing_time,
+    remove_libreoffice_profiles
 )
 from .ocr import test_tesseract_installation, get_tesseract_version
 
@@ -60,6 +61,12 @@ async def startup_event():
         logger.warning("Tesseract OCR is not available - OCR functionality will be limited")
 
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Remove scratch files kept for the lifetime of the service."""
+    remove_libreoffice_profiles()
+
+
 @app.get("/", response_class=HTMLResponse)
 async def root():
     """Return service usage instructions."""
@@ -172,6 +179,7 @@ async def root():
                     <li><code>file</code> (required): PDF file to convert</li>
                     <li><code>ocr_languages</code> (optional): OCR language codes (default: 'eng')</li>
                     <li><code>dehyphenate</code> (optional): Remove hyphenation (default: true)</li>
+                    <li><code>high_accuracy</code> (optional): Slower, more accurate OCR for hard-to-read scans (default: false)</li>
                 </ul>
             </div>
             
@@ -375,7 +383,8 @@ curl -X POST "http://localhost:8000/info-pptx" \\
 async def convert_pdf_to_pptx(
     file: UploadFile = File(...),
     ocr_languages: str = "eng",
-    dehyphenate: bool = True
+    dehyphenate: bool = True,
+    high_accuracy: bool = False
 ):
     """
     Convert a PDF file to PPTX format.
@@ -384,9 +393,10 @@ async def convert_pdf_to_pptx(
         file: PDF file to convert
         ocr_languages: Tesseract language codes for OCR (default: 'eng')
         dehyphenate: Whether to remove end-of-line hyphenation (default: True)
+        high_accuracy: OCR at 300 DPI in color instead of fast grayscale (default: False)
         
     Returns:
-        StreamingResponse with PPTX file
+        Response with PPTX file
         
     Raises:
         HTTPException: If file validation or conversion fails
@@ -409,16 +419,19 @@ async def convert_pdf_to_pptx(
                 detail="Empty file uploaded"
             )
         
+        # Hash the upload once for all the PDF calls below
+        pdf_digest = get_pdf_digest(pdf_content)
+        
         # Validate PDF
-        if not validate_pdf(pdf_content):
+        if not validate_pdf(pdf_content, pdf_digest):
             raise HTTPException(
                 status_code=400,
                 detail="Invalid PDF file"
             )
         
         # Log processing info
-        pdf_info = get_pdf_info(pdf_content)
-        estimated_time = estimate_processing_time(pdf_content)
+        pdf_info = get_pdf_info(pdf_content, pdf_digest)
+        estimated_time = estimate_processing_time(pdf_content, digest=pdf_digest)
         logger.info(f"Converting {pdf_info.get('page_count', 'unknown')} pages, "
                    f"estimated time: {estimated_time:.1f}s")
         
@@ -426,7 +439,9 @@ async def convert_pdf_to_pptx(
         pptx_content = pdf_to_pptx(
             pdf_content, 
             ocr_langs=ocr_languages, 
-            dehyphenate=dehyphenate
+            dehyphenate=dehyphenate,
+            digest=pdf_digest,
+            high_accuracy=high_accuracy
         )
         
         # Generate response filename
@@ -435,13 +450,12 @@ async def convert_pdf_to_pptx(
         
         logger.info(f"Conversion completed: {output_filename} ({len(pptx_content)} bytes)")
         
-        return StreamingResponse(
-            io.BytesIO(pptx_content),
+        # The converted file is already fully in memory; send it as one body
+        # instead of re-wrapping it in a BytesIO and streaming it line by line
+        return Response(
+            content=pptx_content,
             media_type="application/vnd.openxmlformats-officedocument.presentationml.presentation",
-            headers={
-                "Content-Disposition": f"attachment; filename={output_filename}",
-                "Content-Length": str(len(pptx_content))
-            }
+            headers={"Content-Disposition": f"attachment; filename={output_filename}"}
         )
         
     except HTTPException:
@@ -465,7 +479,7 @@ async def convert_pptx_to_pdf(
         file: PPTX file to convert
         
     Returns:
-        StreamingResponse with PDF file
+        Response with PDF file
         
     Raises:
         HTTPException: If file validation or conversion fails
@@ -511,13 +525,12 @@ async def convert_pptx_to_pdf(
         
         logger.info(f"Conversion completed: {output_filename} ({len(pdf_content)} bytes)")
         
-        return StreamingResponse(
-            io.BytesIO(pdf_content),
+        # The converted file is already fully in memory; send it as one body
+        # instead of re-wrapping it in a BytesIO and streaming it line by line
+        return Response(
+            content=pdf_content,
             media_type="application/pdf",
-            headers={
-                "Content-Disposition": f"attachment; filename={output_filename}",
-                "Content-Length": str(len(pdf_content))
-            }
+            headers={"Content-Disposition": f"attachment; filename={output_filename}"}
         )
         
     except HTTPException:
@@ -561,18 +574,23 @@ async def get_pdf_information(file: UploadFile = File(...)):
                 detail="Empty file uploaded"
             )
         
+        # Hash the upload once for all the PDF calls below
+        pdf_digest = get_pdf_digest(pdf_content)
+        
         # Validate PDF
-        if not validate_pdf(pdf_content):
+        if not validate_pdf(pdf_content, pdf_digest):
             raise HTTPException(
                 status_code=400,
                 detail="Invalid PDF file"
             )
         
         # Get PDF information
-        pdf_info = get_pdf_info(pdf_content)
+        pdf_info = get_pdf_info(pdf_content, pdf_digest)
         
         # Add processing estimates
-        pdf_info['estimated_processing_time_seconds'] = estimate_processing_time(pdf_content)
+        pdf_info['estimated_processing_time_seconds'] = estimate_processing_time(
+            pdf_content, digest=pdf_digest
+        )
         pdf_info['file_size_bytes'] = len(pdf_content)
         pdf_info['filename'] = file.filename
         
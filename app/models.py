@@ -16,8 +16,21 @@ PDF_POINTS_PER_INCH = 72.0
 PPTX_EMU_PER_INCH = 914400
 WIDESCREEN_ASPECT_RATIO = 16.0 / 9.0
 MINIMUM_TEXT_THRESHOLD = 20
+LETTER_PAGE_AREA = 612.0 * 792.0  # US Letter in square points
 DEFAULT_OCR_DPI = 300
+FAST_OCR_DPI = 144  # Grayscale render resolution for default-quality OCR
+OCR_BATCH_SIZE = 4  # Pages per Tesseract process with the pytesseract backend
+TESSERACT_ENGINES_PER_THREAD = 2  # Language sets kept loaded per OCR thread
+SLIDE_IMAGE_JPEG_QUALITY = 85  # Image-mode page renders
+IMAGE_RENDER_BLOCK_PAGES = 8  # Pages per image-mode render task
+LIBREOFFICE_CONVERT_TIMEOUT = 60  # Seconds a LibreOffice conversion may take per file
 SLIDE_MARGIN_FACTOR = 0.02  # 2% margin
+MAX_PAGE_WORKERS = 4  # Upper bound for parallel page processing
+PDF_INFO_CACHE_SIZE = 16  # Number of recently probed PDFs to remember
+MAX_UPLOAD_BYTES = 200 * 1024 * 1024  # Reject larger inputs without parsing them
+PDF_MAGIC = b'%PDF-'
+PDF_MAGIC_SEARCH_BYTES = 1024  # Readers accept the header anywhere in the first 1 KB
+ZIP_MAGIC = b'PK\x03\x04'  # PPTX files are ZIP archives
 
 
 class SlideConfig:
@@ -5,25 +5,129 @@ OCR processing module using Tesseract for scanned PDF pages.
 import fitz  # PyMuPDF
 import pytesseract
 from PIL import Image
-from typing import List, Optional
-import io
+from collections import OrderedDict
+from typing import List, Optional, Tuple
 import logging
+import os
+import tempfile
+import threading
 
-from .models import TextBlock, DEFAULT_OCR_DPI
+try:
+    import tesserocr  # In-process Tesseract API (optional)
+except ImportError:
+    tesserocr = None
+
+from .models import TextBlock, DEFAULT_OCR_DPI, FAST_OCR_DPI, TESSERACT_ENGINES_PER_THREAD
 from .utils import pixels_to_pdf_points, normalize_coordinates
 
 logger = logging.getLogger(__name__)
 
+# Pages are already OCR'd in parallel; keep Tesseract's own OpenMP pool from
+# oversubscribing the CPUs. Must be set before Tesseract starts, and is
+# inherited by pytesseract subprocesses and pool workers.
+os.environ.setdefault('OMP_THREAD_LIMIT', '1')
+
+# Per-thread tesserocr engines, keyed by normalized language string
+_tess_local = threading.local()
+
+
+def _normalize_langs(langs: str) -> str:
+    """
+    Normalize a Tesseract language string such as 'eng+deu'.
+    
+    Stray whitespace and repeated codes are dropped. The order is kept, as
+    the first language is Tesseract's primary one.
+    
+    Args:
+        langs: Tesseract language codes joined with '+'
+        
+    Returns:
+        Normalized language string
+    """
+    return '+'.join(dict.fromkeys(lang.strip() for lang in langs.split('+') if lang.strip()))
+
+
+def _get_tess_api(langs: str):
+    """
+    Get the tesserocr engine for the current thread, creating it on first use.
+    
+    Loading the Tesseract models is expensive, so engines are kept alive
+    per thread and reused across pages. The language string comes from the
+    request, so it is normalized and only the TESSERACT_ENGINES_PER_THREAD
+    most recently used language sets stay loaded on each thread.
+    
+    Args:
+        langs: Tesseract language codes
+        
+    Returns:
+        tesserocr.PyTessBaseAPI instance
+    """
+    apis = getattr(_tess_local, 'apis', None)
+    if apis is None:
+        apis = _tess_local.apis = OrderedDict()
+    
+    langs = _normalize_langs(langs)
+    
+    api = apis.get(langs)
+    if api is not None:
+        apis.move_to_end(langs)
+        return api
+    
+    api = tesserocr.PyTessBaseAPI(lang=langs, psm=tesserocr.PSM.SINGLE_BLOCK)
+    apis[langs] = api
+    logger.info(f"Initialized Tesseract engine for '{langs}'")
+    
+    while len(apis) > TESSERACT_ENGINES_PER_THREAD:
+        _, evicted_api = apis.popitem(last=False)
+        evicted_api.End()
+    return api
+
+
+def init_ocr_worker(langs: str = 'eng') -> None:
+    """
+    Initialize OCR state in a worker process.
+    
+    Intended as a process pool initializer so that the Tesseract engine is
+    created once per worker instead of once per page. MuPDF and the
+    Tesseract models are also warmed up here, so the first page handled by
+    each worker doesn't pay the cold-start cost.
+    
+    Args:
+        langs: Tesseract language codes
+    """
+    try:
+        # Force MuPDF's lazy library initialization
+        fitz.open().close()
+    except Exception as e:
+        logger.warning(f"Failed to warm up PyMuPDF: {str(e)}")
+    
+    if tesserocr is None:
+        return
+    
+    try:
+        api = _get_tess_api(langs)
+        # Touch the engine once so the recognition models are fully loaded
+        api.SetImage(Image.new('L', (1, 1), color=255))
+        api.Clear()
+    except Exception as e:
+        logger.warning(f"Failed to initialize Tesseract engine: {str(e)}")
+
 
-def ocr_page_lines(page: fitz.Page, dpi: int = DEFAULT_OCR_DPI, 
-                  langs: str = 'eng') -> List[TextBlock]:
+def ocr_page_lines(page: fitz.Page, dpi: Optional[int] = None, 
+                  langs: str = 'eng', high_accuracy: bool = False) -> List[TextBlock]:
     """
     Perform OCR on a PDF page and return line-level text blocks.
     
+    By default the page is rendered in grayscale at FAST_OCR_DPI, which is
+    enough for text detection and roughly 4x less pixel data for Tesseract
+    than a 300 DPI color render. High-accuracy mode keeps the original
+    DEFAULT_OCR_DPI color render.
+    
     Args:
         page: PyMuPDF page object
-        dpi: DPI for page rendering (default 300)
+        dpi: DPI for page rendering (default depends on high_accuracy)
         langs: Tesseract language codes (default 'eng')
+        high_accuracy: Render at 300 DPI in color instead of fast grayscale
         
     Returns:
         List of text blocks with coordinates and text content
@@ -32,39 +136,230 @@ def ocr_page_lines(page: fitz.Page, dpi: int = DEFAULT_OCR_DPI,
         Exception: If OCR processing fails
     """
     try:
-        # Render page to PNG image
-        mat = fitz.Matrix(dpi / 72, dpi / 72)  # Scale matrix for DPI
-        pix = page.get_pixmap(matrix=mat)
-        img_data = pix.tobytes("png")
+        if dpi is None:
+            dpi = DEFAULT_OCR_DPI if high_accuracy else FAST_OCR_DPI
+        
+        # The image shares the pixmap's memory, so keep both until OCR is done
+        image, pix = render_page_image(page, dpi, high_accuracy)
+        page_rect = page.rect
+        
+        text_blocks = ocr_image_lines(
+            image, dpi, page_rect.width, page_rect.height, langs, high_accuracy
+        )
+        
+        image = None
         pix = None  # Free memory
+        return text_blocks
+        
+    except Exception as e:
+        logger.error(f"OCR processing failed: {str(e)}")
+        raise Exception(f"OCR processing failed: {str(e)}")
+
+
+def render_page_image(page: fitz.Page, dpi: int, 
+                      high_accuracy: bool = False) -> Tuple[Image.Image, fitz.Pixmap]:
+    """
+    Render a PDF page to a PIL image for OCR.
+    
+    The image wraps the pixmap samples without a copy or PNG round-trip, so
+    the returned pixmap must stay alive for as long as the image is in use.
+    
+    Args:
+        page: PyMuPDF page object
+        dpi: DPI for page rendering
+        high_accuracy: Render in color instead of grayscale
+        
+    Returns:
+        Tuple of (image, pixmap)
+    """
+    mat = fitz.Matrix(dpi / 72, dpi / 72)  # Scale matrix for DPI
+    
+    if high_accuracy:
+        # Render page in color
+        pix = page.get_pixmap(matrix=mat, alpha=False)
+        mode = 'RGB'
+    else:
+        # Render straight to 8-bit grayscale
+        pix = page.get_pixmap(matrix=mat, colorspace=fitz.csGRAY)
+        mode = 'L'
+    
+    image = Image.frombuffer(mode, (pix.width, pix.height), pix.samples_mv,
+                             'raw', mode, pix.stride, 1)
+    return image, pix
+
+
+def ocr_image_lines(image: Image.Image, dpi: int, 
+                    page_width_pts: float, page_height_pts: float,
+                    langs: str = 'eng', high_accuracy: bool = False) -> List[TextBlock]:
+    """
+    Run OCR on a rendered page image and return line-level text blocks.
+    
+    Does not touch PyMuPDF, so it can run on a worker thread while the
+    document itself stays on the calling thread.
+    
+    Args:
+        image: Rendered page image
+        dpi: DPI the page was rendered at
+        page_width_pts: Page width in PDF points
+        page_height_pts: Page height in PDF points
+        langs: Tesseract language codes (default 'eng')
+        high_accuracy: Whether the image is a high-accuracy render
         
-        # Convert to PIL Image
-        image = Image.open(io.BytesIO(img_data))
+    Returns:
+        List of text blocks with coordinates and text content
+    """
+    # Perform OCR with line-level data
+    if tesserocr is not None:
+        ocr_data = _tesserocr_image_to_data(image, langs)
+    else:
+        if high_accuracy:
+            tesseract_config = '--psm 6'  # Uniform block of text
+        else:
+            tesseract_config = '--psm 6 --oem 1'  # Uniform block, LSTM engine
         
-        # Perform OCR with line-level data
         ocr_data = pytesseract.image_to_data(
             image, 
-            lang=langs,
+            lang=_normalize_langs(langs),
             output_type=pytesseract.Output.DICT,
-            config='--psm 6'  # Uniform block of text
+            config=tesseract_config
         )
+    
+    # Group words into lines and create text blocks
+    text_blocks = _group_words_into_lines(
+        ocr_data, dpi, page_width_pts, page_height_pts
+    )
+    
+    logger.debug("OCR extracted %d text blocks from page", len(text_blocks))
+    return text_blocks
+
+
+def ocr_images_lines(images: List[Image.Image], dpi: int,
+                     page_sizes: List[Tuple[float, float]],
+                     langs: str = 'eng', high_accuracy: bool = False) -> List[List[TextBlock]]:
+    """
+    Run OCR on several rendered page images and return their text blocks.
+    
+    With pytesseract, the images are handed to a single Tesseract process
+    as an image list, so the models are loaded once per batch instead of
+    once per page. tesserocr keeps its engine loaded anyway and simply
+    recognizes the images one after another.
+    
+    Args:
+        images: Rendered page images
+        dpi: DPI the pages were rendered at
+        page_sizes: (width, height) of each page in PDF points
+        langs: Tesseract language codes (default 'eng')
+        high_accuracy: Whether the images are high-accuracy renders
         
-        # Get page dimensions for coordinate conversion
-        page_rect = page.rect
-        page_width_pts = page_rect.width
-        page_height_pts = page_rect.height
+    Returns:
+        List of text block lists, one per image
+    """
+    if tesserocr is not None or len(images) == 1:
+        return [
+            ocr_image_lines(image, dpi, width, height, langs, high_accuracy)
+            for image, (width, height) in zip(images, page_sizes)
+        ]
+    
+    with tempfile.TemporaryDirectory(prefix='ocr_batch_') as temp_dir:
+        # Uncompressed PNM keeps the hand-off to Tesseract cheap
+        image_paths = []
+        for i, image in enumerate(images):
+            image_path = os.path.join(temp_dir, f"page_{i:04d}.pnm")
+            image.save(image_path, format='PPM')
+            image_paths.append(image_path)
         
-        # Group words into lines and create text blocks
-        text_blocks = _group_words_into_lines(
-            ocr_data, dpi, page_width_pts, page_height_pts
+        list_path = os.path.join(temp_dir, "pages.txt")
+        with open(list_path, 'w') as f:
+            f.write('\n'.join(image_paths) + '\n')
+        
+        if high_accuracy:
+            tesseract_config = '--psm 6'  # Uniform block of text
+        else:
+            tesseract_config = '--psm 6 --oem 1'  # Uniform block, LSTM engine
+        
+        ocr_data = pytesseract.image_to_data(
+            list_path,
+            lang=_normalize_langs(langs),
+            output_type=pytesseract.Output.DICT,
+            config=tesseract_config
         )
+    
+    # Split the combined output by page (page_num is 1-based)
+    pages_data = [{key: [] for key in ocr_data} for _ in images]
+    for i, page_num in enumerate(ocr_data.get('page_num', [])):
+        if 1 <= page_num <= len(images):
+            page_data = pages_data[page_num - 1]
+            for key, values in ocr_data.items():
+                page_data[key].append(values[i])
+    
+    results = []
+    for page_data, (width, height) in zip(pages_data, page_sizes):
+        text_blocks = _group_words_into_lines(page_data, dpi, width, height)
+        logger.debug("OCR extracted %d text blocks from page", len(text_blocks))
+        results.append(text_blocks)
+    
+    return results
+
+
+def has_inprocess_ocr() -> bool:
+    """
+    Check whether OCR runs in-process through tesserocr.
+    
+    tesserocr releases the GIL while recognizing, so OCR can be spread over
+    threads; the pytesseract backend needs separate processes instead.
+    
+    Returns:
+        True if tesserocr is available, False otherwise
+    """
+    return tesserocr is not None
+
+
+def _tesserocr_image_to_data(image: Image.Image, langs: str) -> dict:
+    """
+    Run OCR with the persistent tesserocr engine.
+    
+    Args:
+        image: PIL image of the page
+        langs: Tesseract language codes
         
-        logger.info(f"OCR extracted {len(text_blocks)} text blocks from page")
-        return text_blocks
+    Returns:
+        Word-level OCR data in the same layout as pytesseract's DICT output
+    """
+    api = _get_tess_api(langs)
+    ocr_data = {'text': [], 'conf': [], 'line_num': [],
+                'left': [], 'top': [], 'width': [], 'height': []}
+    
+    try:
+        api.SetImage(image)
+        api.Recognize()
         
-    except Exception as e:
-        logger.error(f"OCR processing failed: {str(e)}")
-        raise Exception(f"OCR processing failed: {str(e)}")
+        iterator = api.GetIterator()
+        if iterator is None:
+            return ocr_data
+        
+        word_level = tesserocr.RIL.WORD
+        line_num = 0
+        for word in tesserocr.iterate_level(iterator, word_level):
+            if word.IsAtBeginningOf(tesserocr.RIL.TEXTLINE):
+                line_num += 1
+            
+            bbox = word.BoundingBox(word_level)
+            if bbox is None:
+                continue
+            
+            x0, y0, x1, y1 = bbox
+            ocr_data['text'].append(word.GetUTF8Text(word_level) or '')
+            ocr_data['conf'].append(word.Confidence(word_level))
+            ocr_data['line_num'].append(line_num)
+            ocr_data['left'].append(x0)
+            ocr_data['top'].append(y0)
+            ocr_data['width'].append(x1 - x0)
+            ocr_data['height'].append(y1 - y0)
+    finally:
+        # Release the page image but keep the loaded models
+        api.Clear()
+    
+    return ocr_data
 
 
 def _group_words_into_lines(ocr_data: dict, dpi: int, 
@@ -6,6 +6,7 @@ from pptx import Presentation
 from pptx.util import Inches, Pt
 from pptx.enum.text import PP_ALIGN, MSO_AUTO_SIZE
 from pptx.dml.color import RGBColor
+from functools import lru_cache
 from typing import List, Tuple
 import io
 import logging
@@ -44,7 +45,6 @@ def create_pptx_from_blocks(text_blocks_by_page: List[List[Tuple[int, int, int,
         # Save to bytes
         pptx_bytes = io.BytesIO()
         prs.save(pptx_bytes)
-        pptx_bytes.seek(0)
         
         logger.info("Natural PowerPoint generation completed successfully")
         return pptx_bytes.getvalue()
@@ -70,14 +70,14 @@ def _create_natural_slide(prs: Presentation,
     slide = prs.slides.add_slide(title_content_layout)
     
     if not text_blocks:
-        logger.info(f"Created blank slide {page_number}")
+        logger.debug("Created blank slide %d", page_number)
         return
     
     # Extract and process text content naturally
     content_text = _extract_natural_content(text_blocks)
     
     if not content_text.strip():
-        logger.info(f"No content found for slide {page_number}")
+        logger.debug("No content found for slide %d", page_number)
         return
     
     # Determine if there's a clear title
@@ -116,7 +116,7 @@ def _create_natural_slide(prs: Presentation,
             else:
                 _add_manual_content_box(slide, content_text)
     
-    logger.info(f"Created natural slide {page_number}")
+    logger.debug("Created natural slide %d", page_number)
 
 
 def _extract_natural_content(text_blocks: List[Tuple[int, int, int, int, str]]) -> str:
@@ -347,6 +347,10 @@ def calculate_optimal_slide_size(pdf_width: float, pdf_height: float) -> SlideCo
     Calculate optimal slide dimensions based on PDF page size.
     Uses standard PowerPoint dimensions.
     
+    Results are memoized per page size (rounded to 0.01 pt), since most
+    inputs share a handful of sizes such as Letter and A4. The returned
+    SlideConfig is shared and must not be modified.
+    
     Args:
         pdf_width: PDF page width in points
         pdf_height: PDF page height in points
@@ -354,6 +358,12 @@ def calculate_optimal_slide_size(pdf_width: float, pdf_height: float) -> SlideCo
     Returns:
         SlideConfig with standard dimensions
     """
+    return _calculate_optimal_slide_size_cached(round(pdf_width, 2), round(pdf_height, 2))
+
+
+@lru_cache(maxsize=32)
+def _calculate_optimal_slide_size_cached(pdf_width: float, pdf_height: float) -> SlideConfig:
+    """Cached implementation of calculate_optimal_slide_size."""
     # Use standard widescreen format
     width_inches = 13.333  # Standard widescreen width
     height_inches = 7.5    # Standard widescreen height
@@ -389,7 +399,6 @@ def create_empty_presentation(slide_count: int, slide_config: SlideConfig) -> by
         # Save to bytes
         pptx_bytes = io.BytesIO()
         prs.save(pptx_bytes)
-        pptx_bytes.seek(0)
         
         logger.info(f"Created empty presentation with {slide_count} slides")
         return pptx_bytes.getvalue()
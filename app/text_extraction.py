@@ -4,28 +4,31 @@ Text extraction and normalization module for PDF processing.
 
 import fitz  # PyMuPDF
 import re
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 import logging
 
-from .models import TextBlock, MINIMUM_TEXT_THRESHOLD
+from .models import TextBlock, MINIMUM_TEXT_THRESHOLD, LETTER_PAGE_AREA
 from .utils import normalize_coordinates
 
 logger = logging.getLogger(__name__)
 
 
-def extract_text_blocks_pymupdf(page: fitz.Page) -> List[TextBlock]:
+def extract_text_blocks_pymupdf(page: fitz.Page,
+                                textpage: Optional[fitz.TextPage] = None) -> List[TextBlock]:
     """
     Extract text blocks from a PDF page using PyMuPDF.
     
     Args:
         page: PyMuPDF page object
+        textpage: Text page already built for this page, if any, so the
+            page content isn't interpreted again
         
     Returns:
         List of text blocks with coordinates and content
     """
     try:
         # Get text blocks from the page
-        text_dict = page.get_text("dict")
+        text_dict = page.get_text("dict", textpage=textpage)
         blocks = text_dict["blocks"]
         text_blocks = []
         
@@ -56,7 +59,7 @@ def extract_text_blocks_pymupdf(page: fitz.Page) -> List[TextBlock]:
                     )
                     text_blocks.append((x0, y0, x1, y1, block_text))
         
-        logger.info(f"Extracted {len(text_blocks)} text blocks using PyMuPDF")
+        logger.debug("Extracted %d text blocks using PyMuPDF", len(text_blocks))
         return text_blocks
         
     except Exception as e:
@@ -64,18 +67,38 @@ def extract_text_blocks_pymupdf(page: fitz.Page) -> List[TextBlock]:
         return []
 
 
-def has_sufficient_text(text_blocks: List[TextBlock]) -> bool:
+def has_sufficient_text(text_blocks: List[TextBlock],
+                        total_chars: Optional[int] = None,
+                        page_area: Optional[float] = None) -> bool:
     """
     Check if the extracted text blocks contain sufficient text.
     
+    The character threshold is scaled down for pages smaller than US Letter,
+    so that small pages (labels, receipts) aren't needlessly sent to OCR.
+    Counting stops as soon as the threshold is reached.
+    
     Args:
         text_blocks: List of text blocks
+        total_chars: Precomputed character count, if already known
+        page_area: Page area in square points, used to scale the threshold
         
     Returns:
         True if text is sufficient, False if OCR fallback is needed
     """
-    total_chars = sum(len(block[4].strip()) for block in text_blocks)
-    return total_chars >= MINIMUM_TEXT_THRESHOLD
+    threshold = MINIMUM_TEXT_THRESHOLD
+    if page_area:
+        threshold = max(1, round(threshold * min(1.0, page_area / LETTER_PAGE_AREA)))
+    
+    if total_chars is not None:
+        return total_chars >= threshold
+    
+    total_chars = 0
+    for block in text_blocks:
+        total_chars += len(block[4].strip())
+        if total_chars >= threshold:
+            return True
+    
+    return False
 
 
 def normalize_and_group_text_blocks(text_blocks: List[TextBlock], 
@@ -96,6 +119,11 @@ def normalize_and_group_text_blocks(text_blocks: List[TextBlock],
     # Filter out empty blocks and normalize text
     normalized_blocks = []
     for x0, y0, x1, y1, text in text_blocks:
+        # Whitespace-only blocks (common in OCR output) would be dropped
+        # after normalization anyway
+        if not text or text.isspace():
+            continue
+        
         # Clean and normalize text
         cleaned_text = _normalize_text(text, dehyphenate)
         if cleaned_text.strip():
@@ -107,7 +135,7 @@ def normalize_and_group_text_blocks(text_blocks: List[TextBlock],
     # Group text into larger, more natural content blocks
     content_blocks = _group_into_content_blocks(sorted_blocks)
     
-    logger.info(f"Normalized {len(text_blocks)} blocks to {len(content_blocks)} content blocks")
+    logger.debug("Normalized %d blocks to %d content blocks", len(text_blocks), len(content_blocks))
     return content_blocks
 
 
@@ -3,7 +3,7 @@ Utility functions for coordinate system conversions and PDF operations.
 """
 
 import fitz  # PyMuPDF
-from typing import Tuple
+from typing import List, Tuple
 from .models import PageDimensions, PDF_POINTS_PER_INCH
 
 
@@ -26,16 +26,16 @@ def get_pdf_dimensions(pdf_path_or_bytes) -> Tuple[PageDimensions, int]:
         else:
             doc = fitz.open(pdf_path_or_bytes)
         
-        if len(doc) == 0:
-            raise ValueError("Empty PDF")
+        with doc:
+            page_count = doc.page_count
+            if page_count == 0:
+                raise ValueError("Empty PDF")
+            
+            # Get dimensions from first page
+            first_page = doc[0]
+            rect = first_page.rect
+            dimensions = (rect.width, rect.height)
         
-        # Get dimensions from first page
-        first_page = doc[0]
-        rect = first_page.rect
-        dimensions = (rect.width, rect.height)
-        page_count = len(doc)
-        
-        doc.close()
         return dimensions, page_count
     
     except Exception as e:
@@ -142,3 +142,31 @@ def apply_margin(x0: float, y0: float, x1: float, y1: float,
         new_y1 = min(max_height, new_y0 + 20)  # Minimum 20 points height
     
     return new_x0, new_y0, new_x1, new_y1
+
+
+def split_page_ranges(page_count: int, num_chunks: int) -> List[range]:
+    """
+    Split page indices into contiguous, near-equal ranges.
+    
+    Args:
+        page_count: Total number of pages
+        num_chunks: Desired number of ranges
+        
+    Returns:
+        List of non-empty ranges covering 0..page_count-1 in order
+    """
+    if page_count <= 0:
+        return []
+    
+    num_chunks = max(1, min(num_chunks, page_count))
+    base_size, remainder = divmod(page_count, num_chunks)
+    
+    ranges = []
+    start = 0
+    for chunk_idx in range(num_chunks):
+        # Spread the remainder over the first chunks
+        size = base_size + (1 if chunk_idx < remainder else 0)
+        ranges.append(range(start, start + size))
+        start += size
+    
+    return ranges
@@ -0,0 +1,270 @@
+"""
+Unit tests for the converter module.
+"""
+
+import io
+import os
+import zipfile
+
+import fitz
+from PIL import Image as PILImage
+from pptx import Presentation
+from pptx.enum.shapes import MSO_SHAPE_TYPE
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+
+from app import converter
+from app.converter import validate_pdf, validate_pptx
+
+
+class TestInputValidation:
+    """Test the cheap pre-checks in input validation."""
+
+    def test_pdf_without_header_rejected(self):
+        """Test that non-PDF bytes are rejected."""
+        assert validate_pdf(b"<html><body>Not a PDF</body></html>") is False
+        assert validate_pdf(b"") is False
+
+    def test_oversized_pdf_rejected(self, monkeypatch):
+        """Test that inputs over the size limit are rejected."""
+        monkeypatch.setattr(converter, "MAX_UPLOAD_BYTES", 16)
+        assert validate_pdf(b"%PDF-1.7\n" + b"0" * 32) is False
+
+    def test_pptx_without_zip_header_rejected(self):
+        """Test that non-ZIP bytes are rejected as PPTX."""
+        assert validate_pptx(b"%PDF-1.7\n") is False
+        assert validate_pptx(b"") is False
+
+
+class TestPdfDigest:
+    """Test the PDF info cache key."""
+
+    def test_digest_matches_content(self):
+        """Test that equal content gives equal digests and different content doesn't."""
+        first = converter.get_pdf_digest(b"%PDF-1.7 first")
+        assert converter.get_pdf_digest(b"%PDF-1.7 first") == first
+        assert converter.get_pdf_digest(b"%PDF-1.7 second") != first
+
+
+class TestNativeTextCheck:
+    """Test the decision between native text and OCR."""
+
+    def test_blank_page_skips_ocr(self):
+        """Test that a page with no text and no graphics isn't sent to OCR."""
+        with fitz.open() as doc:
+            page = doc.new_page()
+            assert converter._extract_native_text_blocks(page) == ([], True)
+
+    def test_graphics_page_uses_ocr(self):
+        """Test that a page with little text but some graphics is sent to OCR."""
+        with fitz.open() as doc:
+            page = doc.new_page()
+            page.draw_rect(fitz.Rect(10, 10, 300, 300))
+            assert converter._extract_native_text_blocks(page) == (None, False)
+
+
+class TestImageMode:
+    """Test PDF to PPTX conversion with pages as pictures."""
+
+    def test_one_picture_per_page(self):
+        """Test that each page becomes its own picture part."""
+        with fitz.open() as doc:
+            for i in range(3):
+                doc.new_page().insert_text((72, 72), f"Page {i + 1}")
+            pdf_bytes = doc.tobytes()
+
+        presentation = Presentation(io.BytesIO(converter._pdf_to_pptx_as_images(pdf_bytes)))
+        partnames = {slide.part.related_part(slide.shapes[0]._pic.blip_rId).partname
+                     for slide in presentation.slides}
+
+        assert len(presentation.slides) == 3
+        assert len(partnames) == 3
+
+    def test_saved_pictures_round_trip(self):
+        """Test that every saved picture keeps its own image data and relationship."""
+        images = []
+        for color in ("red", "green", "blue", "white"):
+            buffer = io.BytesIO()
+            PILImage.new("RGB", (40, 30), color=color).save(buffer, format="JPEG")
+            images.append(buffer.getvalue())
+
+        pptx_bytes = converter._build_image_presentation(iter(images), len(images), 4 / 3)
+
+        # Relationships in the package must all point at existing parts
+        with zipfile.ZipFile(io.BytesIO(pptx_bytes)) as archive:
+            names = set(archive.namelist())
+            media = [name for name in names if name.startswith("ppt/media/")]
+            assert len(media) == len(images)
+            content_types = archive.read("[Content_Types].xml").decode()
+            assert 'Extension="jpeg"' in content_types or 'Extension="jpg"' in content_types
+
+        presentation = Presentation(io.BytesIO(pptx_bytes))
+        assert len(presentation.slides) == len(images)
+        for slide, expected in zip(presentation.slides, images):
+            pictures = [shape for shape in slide.shapes
+                        if shape.shape_type == MSO_SHAPE_TYPE.PICTURE]
+            assert len(pictures) == 1
+            picture = pictures[0]
+            assert picture.image.blob == expected
+            assert picture.image.content_type == "image/jpeg"
+            rel = slide.part.rels[picture._pic.blip_rId]
+            assert rel.reltype == RT.IMAGE
+            assert rel.target_part.partname.lstrip("/") in names
+
+
+class TestProcessingEstimate:
+    """Test the processing time estimate."""
+
+    def test_native_text_pdf_not_charged_for_ocr(self):
+        """Test that born-digital pages are estimated without OCR time."""
+        with fitz.open() as doc:
+            for _ in range(10):
+                doc.new_page().insert_text((72, 72), "Native text that is long enough to use")
+            pdf_bytes = doc.tobytes()
+
+        assert converter.estimate_processing_time(pdf_bytes) == 20.0
+
+    def test_scanned_pdf_charged_for_ocr(self):
+        """Test that pages with only graphics are estimated with OCR time."""
+        with fitz.open() as doc:
+            for _ in range(10):
+                doc.new_page().draw_rect(fitz.Rect(10, 10, 300, 300), fill=(0, 0, 0))
+            pdf_bytes = doc.tobytes()
+
+        assert converter.estimate_processing_time(pdf_bytes) == 70.0
+
+
+class TestHighAccuracyOcr:
+    """Test that the OCR quality mode reaches rendering and Tesseract."""
+
+    def test_high_accuracy_renders_color_at_default_dpi(self, monkeypatch):
+        """Test that high-accuracy conversion OCRs color renders at DEFAULT_OCR_DPI."""
+        calls = []
+
+        def fake_ocr(images, dpi, page_sizes, langs='eng', high_accuracy=False):
+            calls.append((images[0].mode, dpi, high_accuracy))
+            return [[] for _ in images]
+
+        monkeypatch.setattr(converter, "ocr_images_lines", fake_ocr)
+
+        with fitz.open() as doc:
+            page = doc.new_page()
+            page.draw_rect(fitz.Rect(10, 10, 300, 300))
+            pdf_bytes = doc.tobytes()
+
+        converter.pdf_to_pptx(pdf_bytes, num_workers=1, high_accuracy=True)
+        converter.pdf_to_pptx(pdf_bytes, num_workers=1)
+
+        assert calls == [('RGB', converter.DEFAULT_OCR_DPI, True),
+                         ('L', converter.FAST_OCR_DPI, False)]
+
+
+class TestOcrConcurrency:
+    """Test that num_workers bounds concurrent OCR on the shared pool."""
+
+    def test_single_worker_runs_one_ocr_job_at_a_time(self, monkeypatch):
+        """Test that num_workers=1 never runs two OCR batches at once."""
+        lock = converter.threading.Lock()
+        running = [0]
+        peak = [0]
+
+        def fake_ocr(images, dpi, page_sizes, langs='eng', high_accuracy=False):
+            with lock:
+                running[0] += 1
+                peak[0] = max(peak[0], running[0])
+            converter.time.sleep(0.02)
+            with lock:
+                running[0] -= 1
+            return [[] for _ in images]
+
+        # Count jobs handed to the shared pool and not finished yet
+        submitted = [0]
+        peak_submitted = [0]
+        pool = converter.ThreadPoolExecutor(max_workers=4)
+        real_submit = pool.submit
+
+        def counting_submit(*args, **kwargs):
+            with lock:
+                submitted[0] += 1
+                peak_submitted[0] = max(peak_submitted[0], submitted[0])
+            future = real_submit(*args, **kwargs)
+            future.add_done_callback(lambda _: _finished())
+            return future
+
+        def _finished():
+            with lock:
+                submitted[0] -= 1
+
+        pool.submit = counting_submit
+        monkeypatch.setattr(converter, "ocr_images_lines", fake_ocr)
+        monkeypatch.setattr(converter, "has_inprocess_ocr", lambda: True)
+        monkeypatch.setattr(converter, "_get_ocr_thread_pool", lambda: pool)
+
+        with fitz.open() as doc:
+            for _ in range(6):
+                page = doc.new_page()
+                page.draw_rect(fitz.Rect(10, 10, 300, 300))
+            pdf_bytes = doc.tobytes()
+
+        converter.pdf_to_pptx(pdf_bytes, num_workers=1)
+        pool.shutdown()
+        assert peak[0] == 1
+        assert peak_submitted[0] == 1
+
+
+class TestOcrFailureFallback:
+    """Test the native-text fallback when OCR fails."""
+
+    def test_native_blocks_reused(self, monkeypatch):
+        """Test that blocks extracted before OCR are used without extracting again."""
+        native = [(10.0, 10.0, 200.0, 40.0, "Native text")]
+        extract_calls = []
+
+        def failing_ocr(images, dpi, page_sizes, langs='eng', high_accuracy=False):
+            raise RuntimeError("Tesseract failed")
+
+        monkeypatch.setattr(converter, "_extract_native_text_blocks", lambda page: (native, False))
+        monkeypatch.setattr(converter, "extract_text_blocks_pymupdf",
+                            lambda page: extract_calls.append(page) or [])
+        monkeypatch.setattr(converter, "ocr_images_lines", failing_ocr)
+
+        with fitz.open() as doc:
+            doc.new_page()
+            pptx_bytes = converter.pdf_to_pptx(doc.tobytes(), num_workers=1)
+
+        assert extract_calls == []
+        slide = Presentation(io.BytesIO(pptx_bytes)).slides[0]
+        assert any("Native text" in shape.text_frame.text
+                   for shape in slide.shapes if shape.has_text_frame)
+
+
+class TestLibreOfficeTimeout:
+    """Test that a hung LibreOffice run is cleaned up."""
+
+    def test_office_child_killed_and_profile_removed(self, tmp_path, monkeypatch):
+        """Test that the launcher's child process and the run's profile are removed."""
+        child_pid_file = tmp_path / "child.pid"
+        launcher = tmp_path / "libreoffice"
+        launcher.write_text(
+            "#!/bin/sh\n"
+            "sleep 30 > /dev/null 2>&1 &\n"
+            f"echo $! > {child_pid_file}\n"
+            "wait\n"
+        )
+        launcher.chmod(0o755)
+        monkeypatch.setenv("PATH", f"{tmp_path}{os.pathsep}{os.environ['PATH']}")
+        monkeypatch.setattr(converter, "LIBREOFFICE_CONVERT_TIMEOUT", 0.5)
+        profile_dir = tmp_path / "profile"
+        profile_dir.mkdir()
+        monkeypatch.setattr(converter, "_acquire_libreoffice_profile", lambda: str(profile_dir))
+
+        result = converter._convert_pptx_to_pdf_libreoffice(str(tmp_path / "deck.pptx"),
+                                                            str(tmp_path))
+
+        assert result is None
+        assert not profile_dir.exists()
+        child_pid = int(child_pid_file.read_text())
+        try:
+            with open(f"/proc/{child_pid}/stat") as stat:
+                assert stat.read().split(")")[-1].split()[0] == "Z"
+        except FileNotFoundError:
+            pass
@@ -0,0 +1,50 @@
+"""
+Unit tests for the layout module.
+"""
+
+from app.layout import transform_blocks_to_pptx, precompute_transform
+from app.models import SlideConfig, pdf_points_to_emu
+from app.utils import scale_coordinates, apply_margin
+
+
+class TestBlockTransformation:
+    """Test PDF to PPTX block transformation."""
+
+    def test_empty_blocks(self):
+        """Test that no blocks produce no output."""
+        config = SlideConfig(12192000, 6858000)
+        assert transform_blocks_to_pptx([], 612.0, 792.0, config) == []
+
+    def test_matches_helper_functions(self):
+        """Test that the inlined math matches the coordinate helpers."""
+        config = SlideConfig(12192000, 6858000)
+        pdf_width, pdf_height = 612.0, 792.0
+        blocks = [
+            (72.0, 72.0, 540.0, 120.0, "Title"),
+            (0.0, 0.0, 10.0, 5.0, "Corner"),
+            (600.0, 780.0, 612.0, 792.0, "Edge"),
+        ]
+
+        scale_x = config.width_pts / pdf_width
+        scale_y = config.height_pts / pdf_height
+        margin_x = config.width_pts * config.margin_factor
+        margin_y = config.height_pts * config.margin_factor
+
+        expected = []
+        for x0, y0, x1, y1, text in blocks:
+            sx0, sy0 = scale_coordinates(x0, y0, scale_x, scale_y)
+            sx1, sy1 = scale_coordinates(x1, y1, scale_x, scale_y)
+            coords = apply_margin(sx0, sy0, sx1, sy1, margin_x, margin_y,
+                                  config.width_pts, config.height_pts)
+            expected.append(tuple(pdf_points_to_emu(c) for c in coords) + (text,))
+
+        assert transform_blocks_to_pptx(blocks, pdf_width, pdf_height, config) == expected
+
+    def test_precomputed_transform_matches(self):
+        """Test that passing a precomputed transform gives the same result."""
+        config = SlideConfig(12192000, 6858000)
+        blocks = [(72.0, 72.0, 540.0, 120.0, "Title")]
+        transform = precompute_transform(612.0, 792.0, config)
+
+        assert (transform_blocks_to_pptx(blocks, 612.0, 792.0, config, transform)
+                == transform_blocks_to_pptx(blocks, 612.0, 792.0, config))
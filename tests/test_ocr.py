@@ -0,0 +1,73 @@
+"""
+Unit tests for the OCR module.
+"""
+
+from PIL import Image
+
+from app import ocr
+
+
+class TestBatchOcr:
+    """Test batched OCR through a single Tesseract run."""
+
+    def test_results_split_by_page(self, monkeypatch):
+        """Test that combined Tesseract output is mapped back to each page."""
+        calls = []
+
+        def fake_image_to_data(list_path, **kwargs):
+            with open(list_path) as f:
+                calls.append(f.read().split())
+            return {
+                'page_num': [1, 1, 2],
+                'line_num': [1, 1, 1],
+                'text': ['Hello', 'world', 'Second'],
+                'conf': [90, 90, 90],
+                'left': [10, 60, 10],
+                'top': [10, 10, 20],
+                'width': [40, 40, 50],
+                'height': [12, 12, 12],
+            }
+
+        monkeypatch.setattr(ocr, "tesserocr", None)
+        monkeypatch.setattr(ocr.pytesseract, "image_to_data", fake_image_to_data)
+
+        images = [Image.new('L', (100, 100), color=255) for _ in range(2)]
+        results = ocr.ocr_images_lines(images, 72, [(100.0, 100.0), (100.0, 100.0)])
+
+        assert len(calls) == 1 and len(calls[0]) == 2
+        assert [block[4] for block in results[0]] == ['Hello world']
+        assert [block[4] for block in results[1]] == ['Second']
+
+
+class TestTesseractEngineCache:
+    """Test the per-thread tesserocr engine cache."""
+
+    def test_engines_normalized_and_evicted(self, monkeypatch):
+        """Test that repeated codes share an engine and old engines are ended."""
+        ended = []
+
+        class FakeApi:
+            def __init__(self, lang, psm):
+                self.lang = lang
+
+            def End(self):
+                ended.append(self.lang)
+
+        class FakeTesserocr:
+            PyTessBaseAPI = FakeApi
+
+            class PSM:
+                SINGLE_BLOCK = 6
+
+        monkeypatch.setattr(ocr, "tesserocr", FakeTesserocr)
+        monkeypatch.setattr(ocr, "_tess_local", ocr.threading.local())
+        monkeypatch.setattr(ocr, "TESSERACT_ENGINES_PER_THREAD", 2)
+
+        first = ocr._get_tess_api('eng+deu')
+        assert ocr._get_tess_api(' eng+deu+eng ') is first
+        assert first.lang == 'eng+deu'
+
+        # The primary language is kept first, so another order is another engine
+        assert ocr._get_tess_api('deu+eng') is not first
+        ocr._get_tess_api('fra')
+        assert ended == ['eng+deu']
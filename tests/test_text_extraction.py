@@ -0,0 +1,41 @@
+"""
+Unit tests for the text extraction module.
+"""
+
+from app.models import MINIMUM_TEXT_THRESHOLD, LETTER_PAGE_AREA
+from app.text_extraction import has_sufficient_text
+
+
+class TestSufficientText:
+    """Test the native-text sufficiency check."""
+
+    def test_sufficient_text(self):
+        """Test blocks above the threshold."""
+        blocks = [(0.0, 0.0, 100.0, 20.0, "x" * MINIMUM_TEXT_THRESHOLD)]
+        assert has_sufficient_text(blocks) is True
+
+    def test_insufficient_text(self):
+        """Test blocks below the threshold."""
+        blocks = [(0.0, 0.0, 100.0, 20.0, "short")]
+        assert has_sufficient_text(blocks) is False
+
+    def test_whitespace_not_counted(self):
+        """Test that surrounding whitespace does not count as text."""
+        blocks = [(0.0, 0.0, 100.0, 20.0, "   abc   " + " " * MINIMUM_TEXT_THRESHOLD)]
+        assert has_sufficient_text(blocks) is False
+
+    def test_precomputed_total_chars(self):
+        """Test that a precomputed character count is used as-is."""
+        assert has_sufficient_text([], total_chars=MINIMUM_TEXT_THRESHOLD) is True
+        assert has_sufficient_text([], total_chars=0) is False
+
+    def test_small_page_lowers_threshold(self):
+        """Test that the threshold scales down with page area."""
+        blocks = [(0.0, 0.0, 50.0, 10.0, "tiny label")]
+        assert has_sufficient_text(blocks) is False
+        assert has_sufficient_text(blocks, page_area=LETTER_PAGE_AREA / 4) is True
+
+    def test_large_page_keeps_threshold(self):
+        """Test that pages larger than Letter don't raise the threshold."""
+        blocks = [(0.0, 0.0, 100.0, 20.0, "x" * MINIMUM_TEXT_THRESHOLD)]
+        assert has_sufficient_text(blocks, page_area=LETTER_PAGE_AREA * 4) is True
@@ -4,7 +4,8 @@ Unit tests for the utils module.
 
 from app.utils import (
     get_pdf_dimensions, pixels_to_pdf_points, normalize_coordinates,
-    calculate_aspect_ratio, scale_coordinates, apply_margin
+    calculate_aspect_ratio, scale_coordinates, apply_margin,
+    split_page_ranges
 )
 
 
@@ -100,3 +101,28 @@ class TestAspectRatioCalculation:
         # Very tall
         ratio = calculate_aspect_ratio(1, 1000)
         assert ratio == 0.001
+
+
+class TestPageRangeSplitting:
+    """Test splitting pages into contiguous worker ranges."""
+    
+    def test_even_split(self):
+        """Test pages that divide evenly across chunks."""
+        ranges = split_page_ranges(8, 4)
+        assert [list(r) for r in ranges] == [[0, 1], [2, 3], [4, 5], [6, 7]]
+    
+    def test_uneven_split(self):
+        """Test remainder pages go to the first chunks."""
+        ranges = split_page_ranges(7, 3)
+        assert [len(r) for r in ranges] == [3, 2, 2]
+        assert [i for r in ranges for i in r] == list(range(7))
+    
+    def test_more_chunks_than_pages(self):
+        """Test that no empty ranges are produced."""
+        ranges = split_page_ranges(2, 8)
+        assert len(ranges) == 2
+        assert all(len(r) == 1 for r in ranges)
+    
+    def test_no_pages(self):
+        """Test empty documents."""
+        assert split_page_ranges(0, 4) == []